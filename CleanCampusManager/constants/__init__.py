@@ -0,0 +1,48 @@
+"""
+Constants and configuration settings for the Cleaning Management System
+
+Scalars, roles and small tables are imported eagerly from _core. The
+color, badge, notification and path tables live in their own submodules,
+which are only imported the first time one of their names is requested.
+"""
+
+from importlib import import_module
+
+from ._core import (
+    APP_NAME, APP_VERSION, APP_AUTHOR,
+    DEFAULT_BUILDINGS, BLOCKS_PER_BUILDING, ROOMS_PER_BLOCK, PEOPLE_PER_ROOM,
+    TOTAL_PEOPLE_PER_BUILDING, CLEANING_ROTATION_DAYS, DAYS_PER_WEEK,
+    Role, ROLE_NAMES, ROLE_BY_NAME, USER_ROLES,
+    WINDOW_WIDTH, WINDOW_HEIGHT, MIN_WIDTH, MIN_HEIGHT, PADDING, BUTTON_WIDTH, ENTRY_WIDTH,
+    BLOCK_NAMES, DAYS_OF_WEEK, CLEANING_AREAS
+)
+
+# Name -> submodule that defines it, imported on first access (PEP 562)
+_LAZY = {
+    'COLORS': '_gui',
+    'GUI_CONFIG': '_gui',
+    'BADGE_KEYS': '_badges',
+    'BADGE_NAMES': '_badges',
+    'BADGE_DESCS': '_badges',
+    'BADGE_COLORS': '_badges',
+    'BADGE_ICONS': '_badges',
+    'BADGE_ICON_CP': '_badges',
+    'BADGE_TYPES': '_badges',
+    'badge': '_badges',
+    'NOTIFICATION_TYPES': '_notifications',
+    'DATA_PATHS': '_paths'
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining name and cache the value here."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
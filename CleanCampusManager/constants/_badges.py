@@ -0,0 +1,28 @@
+"""
+Badge metadata, stored as parallel tuples indexed like BADGE_KEYS
+"""
+
+from ._sidecar import load
+
+_BADGES = load()['BADGE_TYPES']
+
+BADGE_KEYS = tuple(_BADGES)
+BADGE_NAMES = tuple(info['name'] for info in _BADGES.values())
+BADGE_DESCS = tuple(info['description'] for info in _BADGES.values())
+BADGE_COLORS = tuple(info['color'] for info in _BADGES.values())
+# Icons are stored as codepoints (alarm clock, sports medal, crown, sparkles)
+BADGE_ICON_CP = tuple(info['icon_cp'] for info in _BADGES.values())
+BADGE_ICONS = tuple(map(chr, BADGE_ICON_CP))
+
+
+def badge(index):
+    """Return (name, description, color, icon) for the badge at index"""
+    return BADGE_NAMES[index], BADGE_DESCS[index], BADGE_COLORS[index], BADGE_ICONS[index]
+
+
+# Keyed view of the same table
+BADGE_TYPES = {
+    key: {'name': name, 'description': desc, 'color': color, 'icon': icon}
+    for key, name, desc, color, icon
+    in zip(BADGE_KEYS, BADGE_NAMES, BADGE_DESCS, BADGE_COLORS, BADGE_ICONS)
+}
@@ -0,0 +1,60 @@
+"""
+Scalar settings, roles and small fixed tables
+"""
+
+from enum import IntEnum
+
+# Application constants
+APP_NAME = "Cleaning Management System"
+APP_VERSION = "1.0.0"
+APP_AUTHOR = "University Residence"
+
+# Default building configuration
+DEFAULT_BUILDINGS = 16
+BLOCKS_PER_BUILDING = 2
+ROOMS_PER_BLOCK = 4
+PEOPLE_PER_ROOM = 2
+TOTAL_PEOPLE_PER_BUILDING = BLOCKS_PER_BUILDING * ROOMS_PER_BLOCK * PEOPLE_PER_ROOM
+
+# Cleaning schedule constants
+CLEANING_ROTATION_DAYS = 3
+DAYS_PER_WEEK = 7
+
+# User roles
+class Role(IntEnum):
+    """In-memory user role; ROLE_NAMES holds the value stored in users.json"""
+    STUDENT = 0
+    CHIEF = 1
+    ADMIN = 2
+
+ROLE_NAMES = ('student', 'chief', 'admin')
+ROLE_BY_NAME = {name: Role(index) for index, name in enumerate(ROLE_NAMES)}
+
+USER_ROLES = {role.name: ROLE_NAMES[role] for role in Role}
+
+# GUI Configuration
+WINDOW_WIDTH = 1200
+WINDOW_HEIGHT = 800
+MIN_WIDTH = 1000
+MIN_HEIGHT = 600
+PADDING = 10
+BUTTON_WIDTH = 15
+ENTRY_WIDTH = 20
+
+# Block names
+BLOCK_NAMES = ('A', 'B')
+
+# Days of the week in English
+DAYS_OF_WEEK = (
+    'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'
+)
+
+# Cleaning areas
+CLEANING_AREAS = (
+    'Rooms',
+    'Showers',
+    'Kitchen',
+    'Living Room',
+    'Terrace',
+    'Hallway'
+)
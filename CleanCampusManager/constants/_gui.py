@@ -0,0 +1,20 @@
+"""
+Color palette and window configuration
+"""
+
+from ._core import (WINDOW_WIDTH, WINDOW_HEIGHT, MIN_WIDTH, MIN_HEIGHT,
+                    PADDING, BUTTON_WIDTH, ENTRY_WIDTH)
+from ._sidecar import load
+
+# Colors for different themes
+COLORS = load()['COLORS']
+
+GUI_CONFIG = {
+    'WINDOW_WIDTH': WINDOW_WIDTH,
+    'WINDOW_HEIGHT': WINDOW_HEIGHT,
+    'MIN_WIDTH': MIN_WIDTH,
+    'MIN_HEIGHT': MIN_HEIGHT,
+    'PADDING': PADDING,
+    'BUTTON_WIDTH': BUTTON_WIDTH,
+    'ENTRY_WIDTH': ENTRY_WIDTH
+}
@@ -0,0 +1,7 @@
+"""
+Notification type labels
+"""
+
+from ._sidecar import load
+
+NOTIFICATION_TYPES = load()['NOTIFICATION_TYPES']
@@ -0,0 +1,16 @@
+"""
+Data file locations
+"""
+
+from pathlib import Path
+
+_DATA = Path('data')
+
+DATA_PATHS = {
+    'USERS': _DATA / 'users.json',
+    'BUILDINGS': _DATA / 'buildings.json',
+    'SCHEDULES': _DATA / 'schedules.json',
+    'BADGES': _DATA / 'badges.json',
+    'NOTIFICATIONS': _DATA / 'notifications.json',
+    'STUDENTS': _DATA / 'students.json'
+}
@@ -0,0 +1,27 @@
+"""
+Loader for the color, badge and notification tables in data/constants_data.json
+"""
+
+import json
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+SIDECAR_PATH = Path(__file__).resolve().parent.parent / 'data' / 'constants_data.json'
+
+
+def _intern_strings(value):
+    """Intern every string so repeated literals (e.g. shared colors) are one object"""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict):
+        return {sys.intern(k): _intern_strings(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    return value
+
+
+@lru_cache(maxsize=1)
+def load():
+    """Parse the sidecar once and return its top-level tables"""
+    return _intern_strings(json.loads(SIDECAR_PATH.read_bytes()))
@@ -1,16 +1,183 @@
+import copy
 import tkinter as tk
 from tkinter import ttk, messagebox
-from datetime import datetime, timedelta
-from typing import Optional
+from collections import Counter, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from itertools import chain
+from operator import attrgetter
+from typing import Callable, Optional
+import logging
 import traceback
 
 from models.student import Student
 from models.building import Building
 from models.group import CleaningGroup
+from models.notification import Notification
 from services.scheduler import CleaningScheduler
 from services.data_manager import DataManager
 from services.exporter import DataExporter
-from constants import COLORS, USER_ROLES, CLEANING_AREAS, BADGE_TYPES
+from constants import (COLORS, USER_ROLES, CLEANING_AREAS, BADGE_TYPES, BADGE_KEYS, badge,
+                       Role, ROLE_BY_NAME,
+                       TOTAL_PEOPLE_PER_BUILDING, WINDOW_WIDTH, WINDOW_HEIGHT)
+
+logger = logging.getLogger(__name__)
+
+
+# Display label per role (login notifications, top bar)
+_ROLE_LABEL = {
+    Role.ADMIN: "Administrator",
+    Role.CHIEF: "Building Chief",
+    Role.STUDENT: "Student",
+}
+
+# Role shown after the user's name in the top bar; other roles are read-only
+_ROLE_SUFFIX = {role: f" ({_ROLE_LABEL[role]})" for role in (Role.ADMIN, Role.CHIEF)}
+
+# Sidebar navigation per role: (button text, CleaningManagementApp method name)
+_SIDEBAR_SPECS = {
+    Role.ADMIN: (
+        ("📊 Dashboard", 'show_admin_dashboard'),
+        ("🏢 Building Management", 'show_buildings_management'),
+        ("📈 Reports", 'show_reports'),
+        ("💾 Backup", 'show_backup_options'),
+    ),
+    Role.CHIEF: (
+        ("📊 My Building", 'show_building_dashboard'),
+        ("👥 Student Management", 'show_students_management'),
+        ("🔄 Cleaning Groups", 'show_groups_management'),
+        ("📅 Weekly Schedule", 'show_weekly_schedule'),
+        ("📋 Task Tracking", 'show_tasks_tracking'),
+        ("🔔 Notifications", 'show_notifications'),
+        ("📈 Performance", 'show_performance_metrics'),
+        ("📤 Export Data", 'show_export_options'),
+    ),
+    Role.STUDENT: (
+        ("📅 General Schedule", 'show_general_schedule'),
+        ("🏢 Buildings", 'show_buildings_info'),
+        ("📊 Statistics", 'show_general_stats'),
+        ("🏆 Rankings", 'show_rankings'),
+        ("🏅 Badges", 'show_public_badges'),
+        ("🔔 Notifications", 'show_public_notifications'),
+    ),
+}
+
+# Icons for notification types
+_NOTIFICATION_ICONS = {
+    'TASK_COMPLETED': '✅',
+    'BADGE_EARNED': '🏆',
+    'SCHEDULE_UPDATED': '📅',
+    'INFO': 'ℹ️',
+    'REMINDER': '⏰',
+    'ANNOUNCEMENT': '📢'
+}
+_NOTIFICATION_TIMESTAMP = attrgetter('timestamp')
+
+# ttk style name -> options, applied once by CleaningManagementApp.setup_styles
+_STYLE_SPEC = (
+    # Label styles
+    ('Title.TLabel', {'font': ('Arial', 16, 'bold'), 'foreground': '#2c3e50'}),
+    ('Heading.TLabel', {'font': ('Arial', 12, 'bold'), 'foreground': '#34495e'}),
+    ('Info.TLabel', {'font': ('Arial', 10), 'foreground': '#7f8c8d'}),
+    # Button styles
+    ('Primary.TButton', {'background': '#3498db', 'foreground': 'white', 'font': ('Arial', 10, 'bold')}),
+    ('Secondary.TButton', {'background': '#95a5a6', 'foreground': 'white', 'font': ('Arial', 10)}),
+    ('Danger.TButton', {'background': '#e74c3c', 'foreground': 'white', 'font': ('Arial', 10, 'bold')}),
+    ('Success.TButton', {'background': '#27ae60', 'foreground': 'white', 'font': ('Arial', 10, 'bold')}),
+    # Treeview styles
+    ('Treeview', {'background': 'white', 'foreground': 'black', 'fieldbackground': 'white',
+                  'font': ('Arial', 9)}),
+    ('Treeview.Heading', {'background': '#ecf0f1', 'foreground': '#2c3e50', 'font': ('Arial', 9, 'bold')}),
+    # Frame styles
+    ('Card.TFrame', {'background': 'white', 'relief': 'raised', 'borderwidth': 1}),
+    # Styles for statistics labels
+    ('StatValue.TLabel', {'font': ('Arial', 18, 'bold'), 'foreground': '#3498db'}),
+    ('StatLabel.TLabel', {'font': ('Arial', 10), 'foreground': '#7f8c8d'}),
+)
+
+
+def insert_tree_rows(tree: ttk.Treeview, rows, tags: tuple = (), iids=None, row_tags=None) -> None:
+    """Append value rows to a Treeview with direct Tcl calls (no per-row option formatting).
+
+    Tags are applied in the same insert call, so row styling costs no extra Tcl round trip.
+    If iids is given, it supplies the item id of each row (in order); row_tags likewise
+    supplies per-row tags in place of the shared ones.
+    """
+    call = tree.tk.call
+    path = str(tree)
+    if row_tags is not None:
+        if iids is None:
+            for values, item_tags in zip(rows, row_tags):
+                call(path, 'insert', '', 'end', '-values', values, '-tags', item_tags)
+        else:
+            for iid, values, item_tags in zip(iids, rows, row_tags):
+                call(path, 'insert', '', 'end', '-id', iid, '-values', values, '-tags', item_tags)
+        return
+    options = ('-tags', tags) if tags else ()
+    if iids is None:
+        for values in rows:
+            call(path, 'insert', '', 'end', '-values', values, *options)
+    else:
+        for iid, values in zip(iids, rows):
+            call(path, 'insert', '', 'end', '-id', iid, '-values', values, *options)
+
+
+def count_group_badges(members, students: dict) -> Counter:
+    """Count the badges held by a group's members, by badge key."""
+    counts = Counter()
+    for member_id in members:
+        student = students.get(member_id)
+        if student is not None:
+            counts.update(student.badges)
+    return counts
+
+
+def badge_count_labels(counts: Counter) -> list:
+    """'<icon> x<count>' for each known badge held, in badge order."""
+    return [f"{BADGE_TYPES[key]['icon']} x{counts[key]}" for key in BADGE_KEYS if counts[key]]
+
+
+class LazyTreeview:
+    """Insert Treeview rows in batches as the user scrolls towards the end.
+
+    With format_row, rows holds source objects that are turned into value
+    tuples only when their batch is inserted. With key, each row is inserted
+    under the item id key(row), so callers can find rows without scanning.
+    tags may also be a callable returning the tags of a source row.
+    """
+
+    def __init__(self, tree: ttk.Treeview, scrollbar: ttk.Scrollbar, rows: list,
+                 batch_size: int = 50, tags=(),
+                 format_row: Optional[Callable] = None,
+                 key: Optional[Callable] = None) -> None:
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.rows = rows
+        self.batch_size = batch_size
+        self.tags = tags
+        self.format_row = format_row
+        self.key = key
+        self.inserted = 0
+        tree.configure(yscrollcommand=self._on_yscroll)
+        self.insert_next_batch()
+
+    def insert_next_batch(self) -> None:
+        """Append the next batch of pending rows to the tree."""
+        end = min(self.inserted + self.batch_size, len(self.rows))
+        source = self.rows[self.inserted:end]
+        batch = source if self.format_row is None else map(self.format_row, source)
+        iids = None if self.key is None else map(self.key, source)
+        if callable(self.tags):
+            insert_tree_rows(self.tree, batch, iids=iids, row_tags=map(self.tags, source))
+        else:
+            insert_tree_rows(self.tree, batch, self.tags, iids)
+        self.inserted = end
+
+    def _on_yscroll(self, first: str, last: str) -> None:
+        """Update the scrollbar and load more rows once the view nears the end."""
+        self.scrollbar.set(first, last)
+        if float(last) > 0.9 and self.inserted < len(self.rows):
+            self.insert_next_batch()
 
 
 class CleaningManagementApp:
@@ -26,10 +193,28 @@ class CleaningManagementApp:
         self.current_user = None
         self.current_role = None
         self.style = ttk.Style()
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._data_ready = False
+        self._refresh_after_id = None
+        self._refresh_pending = False
+        self._login_screen = None
+        self._layout_cache = {}
+        self._refresh_groups_debounced = self._debounced(self.show_groups_management, 150)
+        # Coalesces bursts of button presses into one notification list rebuild
+        self._refresh_notifications_debounced = self._debounced(self.refresh_notifications, 80)
+        self._notif_flush_after_id = None
+        # What the notification list currently shows, see _notifications_signature
+        self._last_notif_sig = None
+        # Right-click menus, created on first use and reused afterwards
+        self._student_ctx_menu = None
+        self._task_ctx_menu = None
+        # Notification dialogs, likewise built once and hidden between uses
+        self._create_notif_dialog = None
+        self._notif_details_dialog = None
     
         # Configuration of the main window
         self.root.title("CleanCampus Manager")
-        self.root.geometry("1200x800")
+        self.root.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.root.minsize(800, 600)
         self.root.configure(bg=COLORS['BG_MAIN'])
 
@@ -37,95 +222,125 @@ class CleaningManagementApp:
         self.setup_styles()
         self.setup_main_frame()
     
-        # Loading data and initial display
-        self.data_manager.load_all_data()
-        self.root.after(600000, self._auto_refresh_data)
-        self._auto_refresh_data()
+        # Initial display, with the data files read in the background
         self.show_login_screen()
+        self._run_in_background(self.data_manager.read_data_files, self._on_initial_load_done)
+
+    def _on_initial_load_done(self, future: Future) -> None:
+        """Load the data files read in the background, then enable the login screen."""
+        try:
+            self.data_manager.apply_data_files(future.result())
+        except Exception as e:
+            logger.exception("Error loading data")
+            messagebox.showerror("Error", f"Error loading data:\n{str(e)}")
+        finally:
+            self._data_ready = True
+            self._set_login_enabled(True)
+            self.root.bind('<Map>', self._on_root_map, add='+')
+            self._schedule_auto_refresh()
+
+    def _set_login_enabled(self, enabled: bool) -> None:
+        """Toggle the login screen actions while data is loading."""
+        state = '!disabled' if enabled else 'disabled'
+        for widget in self._login_actions:
+            if widget.winfo_exists():
+                widget.state([state])
+        if enabled and self.loading_label.winfo_exists():
+            self.loading_label.destroy()
+
+    def _run_in_background(self, task: Callable, on_done: Callable[[Future], None]) -> None:
+        """Run task on a worker thread, then call on_done(future) on the Tk thread."""
+        self._watch_future(self._executor.submit(task), on_done)
+
+    def _watch_future(self, future: Future, on_done: Callable[[Future], None]) -> None:
+        """Poll future from the Tk event loop and hand it to on_done once finished."""
+        if future.done():
+            on_done(future)
+        else:
+            self.root.after(50, self._watch_future, future, on_done)
+
+    def _debounced(self, func: Callable, delay_ms: int) -> Callable:
+        """Wrap func so a burst of calls runs it once, delay_ms after the last call.
+
+        The wrapper's cancel() drops a call that is still pending.
+        """
+        after_id = None
+
+        def run(*args):
+            nonlocal after_id
+            after_id = None
+            func(*args)
+
+        def cancel():
+            nonlocal after_id
+            if after_id is not None:
+                self.root.after_cancel(after_id)
+                after_id = None
+
+        def debounced(*args):
+            nonlocal after_id
+            cancel()
+            after_id = self.root.after(delay_ms, run, *args)
+
+        debounced.cancel = cancel
+        return debounced
+
+    def _schedule_auto_refresh(self) -> None:
+        """Arm the 10 minute auto-refresh timer, replacing any pending one."""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(600000, self._auto_refresh_data)  # 10 minutes = 600000 ms
+
+    def _on_root_map(self, event: tk.Event) -> None:
+        """Run a refresh skipped while the window was hidden as soon as it is shown again."""
+        if event.widget is self.root and self._refresh_pending:
+            if self._refresh_after_id is not None:
+                self.root.after_cancel(self._refresh_after_id)
+            self._auto_refresh_data()
 
     def _auto_refresh_data(self) -> None:
         """Auto-refresh data every 10 minutes"""
+        self._refresh_after_id = None
+        if self.root.state() in ('iconic', 'withdrawn'):
+            # Nothing is visible; catch up on <Map> instead
+            self._refresh_pending = True
+            self._schedule_auto_refresh()
+            return
+        self._refresh_pending = False
+        # Only files that changed on disk are re-read, off the Tk thread
+        self._run_in_background(self.data_manager.read_data_files, self._on_auto_refresh_done)
+
+    def _on_auto_refresh_done(self, future: Future) -> None:
+        """Load the re-read files, report refresh errors and schedule the next refresh."""
         try:
-            self.data_manager.load_all_data()
+            self.data_manager.apply_data_files(future.result())
         except Exception as e:
-            print(f"Error during data refresh:\n{str(e)}\n{traceback.format_exc()}")
+            logger.exception("Error during data refresh")
             messagebox.showerror("Error", f"Error during data refresh:\n{str(e)}")
         finally:
-            self.root.after(600000, self._auto_refresh_data)  # 10 minutes = 600000 ms
+            self._schedule_auto_refresh()
 
     def setup_main_frame(self) -> None:
-        """Set up the main application frame"""
+        """Set up the main application frame (once)"""
+        if getattr(self, 'main_frame', None) is not None:
+            return
         self.main_frame = ttk.Frame(self.root)
         self.main_frame.pack(fill='both', expand=True, padx=5, pady=5)
 
     def setup_styles(self) -> None:
         """Configure application styles."""
-        self.style = ttk.Style()
-        
-        # Color configuration
-        self.style.configure('Title.TLabel', font=('Arial', 16, 'bold'), foreground='#2c3e50')
-        self.style.configure('Heading.TLabel', font=('Arial', 12, 'bold'), foreground='#34495e')
-        self.style.configure('Info.TLabel', font=('Arial', 10), foreground='#7f8c8d')
-        
-        # Button styles
-        self.style.configure('Primary.TButton', 
-                       background='#3498db', 
-                       foreground='white',
-                       font=('Arial', 10, 'bold'))
-        
-        self.style.configure('Secondary.TButton', 
-                       background='#95a5a6', 
-                       foreground='white',
-                       font=('Arial', 10))
-        
-        self.style.configure('Danger.TButton', 
-                       background='#e74c3c', 
-                       foreground='white',
-                       font=('Arial', 10, 'bold'))
-        
-        self.style.configure('Success.TButton', 
-                       background='#27ae60', 
-                       foreground='white',
-                       font=('Arial', 10, 'bold'))
-        
-        # Treeview styles
-        self.style.configure('Treeview', 
-                       background='white',
-                       foreground='black',
-                       fieldbackground='white',
-                       font=('Arial', 9))
-        
-        self.style.configure('Treeview.Heading', 
-                       background='#ecf0f1',
-                       foreground='#2c3e50',
-                       font=('Arial', 9, 'bold'))
-        
-        # Frame styles
-        self.style.configure('Card.TFrame', 
-                       background='white',
-                       relief='raised',
-                       borderwidth=1)
-        
-        # Styles for statistics labels
-        self.style.configure('StatValue.TLabel', 
-                       font=('Arial', 18, 'bold'),
-                       foreground='#3498db')
-        
-        self.style.configure('StatLabel.TLabel', 
-                       font=('Arial', 10),
-                       foreground='#7f8c8d')
-    
-    def setup_main_window(self) -> None:
-        """Set up the main application window."""
-        self.root.configure(bg=COLORS['BG_MAIN'])
-        self.main_frame = ttk.Frame(self.root)
-        self.main_frame.pack(fill='both', expand=True, padx=5, pady=5)
+        for name, options in _STYLE_SPEC:
+            self.style.configure(name, **options)
     
     def show_login_screen(self) -> None:
         """Display the login screen."""
-        self._clear_frame(self.main_frame)
+        self._hide_layouts()
+        if self._login_screen is not None:
+            self._login_screen.destroy()
+        screen = self._login_screen = ttk.Frame(self.main_frame)
+        screen.pack(fill='both', expand=True)
         
-        login_frame = ttk.Frame(self.main_frame, style='Card.TFrame')
+        login_frame = ttk.Frame(screen, style='Card.TFrame')
         login_frame.pack(expand=True, fill='both', padx=50, pady=50)
         
         ttk.Label(login_frame, text="Cleaning Management System", 
@@ -148,23 +363,32 @@ class CleaningManagementApp:
                                       style='Primary.TButton', command=self.handle_login)
         self.login_button.pack(pady=10)
         
-        ttk.Button(login_frame, text="Guest Access (Read-only)",
-                   style='Secondary.TButton', command=self.handle_guest_access).pack(pady=5)
+        guest_button = ttk.Button(login_frame, text="Guest Access (Read-only)",
+                                  style='Secondary.TButton', command=self.handle_guest_access)
+        guest_button.pack(pady=5)
+
+        self.loading_label = ttk.Label(login_frame, text="Loading data…", style='Info.TLabel')
 
         # Separator before create account
-        ttk.Separator(self.main_frame, orient='horizontal').pack(fill='x', padx=20, pady=10)
+        ttk.Separator(screen, orient='horizontal').pack(fill='x', padx=20, pady=10)
         
         # --- Create Account Section ---
-        create_account_frame = ttk.Frame(self.main_frame)
+        create_account_frame = ttk.Frame(screen)
         create_account_frame.pack(fill='x', padx=20, pady=(0, 10))
         
         ttk.Label(create_account_frame, text="New building chief?", 
                   style='Muted.TLabel').pack(side='left')
-        ttk.Button(create_account_frame, text="Create an account",
-                   style='Link.TButton', command=self.show_create_account_dialog).pack(side='right')
+        create_account_button = ttk.Button(create_account_frame, text="Create an account",
+                                           style='Link.TButton', command=self.show_create_account_dialog)
+        create_account_button.pack(side='right')
+
+        self._login_actions = (self.login_button, guest_button, create_account_button)
+        if not self._data_ready:
+            self.loading_label.pack(pady=5)
+            self._set_login_enabled(False)
 
         # --- Admin Credentials Section at the bottom ---
-        admin_cred_frame = ttk.LabelFrame(self.main_frame, text="🔒 Administrator Access", padding=15)
+        admin_cred_frame = ttk.LabelFrame(screen, text="🔒 Administrator Access", padding=15)
         admin_cred_frame.pack(fill='x', padx=20, pady=(10, 20), side='bottom')
 
         # Frame to hold the actual credentials and the copy button
@@ -197,12 +421,15 @@ class CleaningManagementApp:
                                  style='Secondary.TButton', command=copy_admin_credentials)
         copy_button.pack(side='right', anchor='center', padx=(10, 0))
 
-        # Bind enter key
-        self.root.bind('<Return>', lambda e: self.handle_login())
+        # Bind enter key on the entries; the bindings go away with the login screen
+        self.username_entry.bind('<Return>', lambda e: self.password_entry.focus())
+        self.password_entry.bind('<Return>', lambda e: self.handle_login())
         self.username_entry.focus()
     
     def handle_login(self) -> None:
         """Handle user login with validation."""
+        if not self._data_ready:
+            return
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         
@@ -214,10 +441,10 @@ class CleaningManagementApp:
         
         if user:
             self.current_user = user
-            self.current_role = user['role']
+            self.current_role = ROLE_BY_NAME.get(user['role'], Role.STUDENT)
             
             # Add a login notification
-            role_text = "Administrator" if user.get('role') == 'ADMIN' else "Building Chief" if user.get('role') == 'CHIEF' else "Student"
+            role_text = _ROLE_LABEL.get(self.current_role, "Student")
             self.data_manager.add_notification(
                 f"Login of {user.get('name', username)} ({role_text})",
                 'SYSTEM_LOGIN',
@@ -235,7 +462,7 @@ class CleaningManagementApp:
             'role': USER_ROLES['STUDENT'],
             'name': 'Guest'
         }
-        self.current_role = USER_ROLES['STUDENT']
+        self.current_role = Role.STUDENT
         self.show_main_interface()
     
     def _clear_frame(self, frame: ttk.Frame) -> None:
@@ -283,9 +510,7 @@ class CleaningManagementApp:
         building_combo = ttk.Combobox(dialog, textvariable=building_var, 
                                     font=('Segoe UI', 10), width=22, state='readonly')
         
-        available_buildings = [f"{b.id} - {b.name}" for b in self.data_manager.buildings.values() 
-                             if not b.chief_id]
-        building_combo['values'] = available_buildings
+        building_combo['values'] = self.data_manager.get_unassigned_building_labels()
         building_combo.pack(pady=(0, 20))
         
         button_frame = ttk.Frame(dialog)
@@ -341,43 +566,52 @@ class CleaningManagementApp:
     
     def _center_window(self, window: tk.Toplevel, width: int, height: int) -> None:
         """Center a window on the screen."""
-        window.update_idletasks()
-        x = (window.winfo_screenwidth() // 2) - (width // 2)
-        y = (window.winfo_screenheight() // 2) - (height // 2)
+        x = (window.winfo_screenwidth() - width) // 2
+        y = (window.winfo_screenheight() - height) // 2
         window.geometry(f"{width}x{height}+{x}+{y}")
     
     def show_main_interface(self) -> None:
         """Display the main application interface based on user role."""
-        self._clear_frame(self.main_frame)
-        self.create_main_layout()
-        
-        if self.current_role == USER_ROLES['ADMIN']:
+        if self._login_screen is not None:
+            self._login_screen.destroy()
+            self._login_screen = None
+        self._hide_layouts()
+        
+        # The top bar and sidebar are built once per role and reused afterwards
+        layout = self._layout_cache.get(self.current_role)
+        if layout is None:
+            layout = self._layout_cache[self.current_role] = self.create_main_layout()
+        layout_frame, welcome_label, self.sidebar_frame, self.content_frame = layout
+        
+        suffix = _ROLE_SUFFIX.get(self.current_role, " (Read-only)")
+        welcome_label.configure(text=f"Welcome, {self.current_user['name']}{suffix}")
+        layout_frame.pack(fill='both', expand=True)
+        
+        if self.current_role == Role.ADMIN:
             self.show_admin_interface()
-        elif self.current_role == USER_ROLES['CHIEF']:
+        elif self.current_role == Role.CHIEF:
             self.show_chief_interface()
         else:
             self.show_student_interface()
     
-    def create_main_layout(self) -> None:
-        """Create the main application layout with top bar and sidebar."""
-        top_bar = ttk.Frame(self.main_frame, style='Sidebar.TFrame')
-        top_bar.pack(fill='x', pady=(0, 5))
+    def create_main_layout(self) -> tuple:
+        """Create the main layout with top bar and sidebar for the current role.
+
+        Returns (layout frame, welcome label, sidebar frame, content frame).
+        """
+        layout_frame = ttk.Frame(self.main_frame)
         
-        welcome_text = f"Welcome, {self.current_user['name']}"
-        if self.current_role == USER_ROLES['ADMIN']:
-            welcome_text += " (Administrator)"
-        elif self.current_role == USER_ROLES['CHIEF']:
-            welcome_text += " (Building Chief)"
-        else:
-            welcome_text += " (Read-only)"
+        top_bar = ttk.Frame(layout_frame, style='Sidebar.TFrame')
+        top_bar.pack(fill='x', pady=(0, 5))
         
-        ttk.Label(top_bar, text=welcome_text, style='Heading.TLabel',
-                 background=COLORS['SECONDARY'], foreground='white').pack(side='left', padx=10, pady=5)
+        welcome_label = ttk.Label(top_bar, style='Heading.TLabel',
+                                  background=COLORS['SECONDARY'], foreground='white')
+        welcome_label.pack(side='left', padx=10, pady=5)
         
         ttk.Button(top_bar, text="Log Out", style='Secondary.TButton',
                   command=self.logout).pack(side='right', padx=10, pady=5)
         
-        content_paned = ttk.PanedWindow(self.main_frame, orient='horizontal')
+        content_paned = ttk.PanedWindow(layout_frame, orient='horizontal')
         content_paned.pack(fill='both', expand=True)
         
         self.sidebar_frame = ttk.Frame(content_paned, style='Sidebar.TFrame', width=200)
@@ -387,6 +621,12 @@ class CleaningManagementApp:
         content_paned.add(self.content_frame, weight=4)
         
         self.create_sidebar()
+        return layout_frame, welcome_label, self.sidebar_frame, self.content_frame
+    
+    def _hide_layouts(self) -> None:
+        """Hide every cached role layout without destroying it."""
+        for layout in self._layout_cache.values():
+            layout[0].pack_forget()
     
     def create_sidebar(self) -> None:
         """Create the sidebar navigation based on user role."""
@@ -394,87 +634,14 @@ class CleaningManagementApp:
         ttk.Label(self.sidebar_frame, text="Navigation", style='Heading.TLabel',
                  background=COLORS['SECONDARY'], foreground='white').pack(pady=10)
         
-        if self.current_role == USER_ROLES['ADMIN']:
-            self._create_admin_sidebar()
-        elif self.current_role == USER_ROLES['CHIEF']:
-            self._create_chief_sidebar()
-        else:
-            self._create_student_sidebar()
-    
-    def _create_admin_sidebar(self) -> None:
-        """Create sidebar for admin users."""
-        buttons = [
-            ("📊 Dashboard", self.show_admin_dashboard),
-            ("🏢 Building Management", self.show_buildings_management),
-            ("📈 Reports", self.show_reports),
-            ("💾 Backup", self.show_backup_options)
-        ]
-        self._create_sidebar_buttons(buttons)
-    
-    def _create_chief_sidebar(self) -> None:
-        """Create sidebar for chief users."""
-        buttons = [
-            ("📊 My Building", self.show_building_dashboard),
-            ("👥 Student Management", self.show_students_management),
-            ("🔄 Cleaning Groups", self.show_groups_management),
-            ("📅 Weekly Schedule", self.show_weekly_schedule),
-            ("📋 Task Tracking", self.show_tasks_tracking),
-            ("🔔 Notifications", self.show_notifications),
-            ("📈 Performance", self.show_performance_metrics),
-            ("📤 Export Data", self.show_export_options)
-        ]
-        self._create_sidebar_buttons(buttons)
-
-    def _create_student_sidebar(self) -> None:
-        """Create sidebar for student/guest users."""
-        buttons = [
-            ("📅 General Schedule", self.show_general_schedule),
-            ("🏢 Buildings", self.show_buildings_info),
-            ("📊 Statistics", self.show_general_stats),
-            ("🏆 Rankings", self.show_rankings),
-            ("🏅 Badges", self.show_public_badges),
-            ("🔔 Notifications", self.show_public_notifications)
-        ]
-        self._create_sidebar_buttons(buttons)
-    
-    def _create_sidebar_buttons(self, buttons: list) -> None:
-        """Create sidebar buttons from a list of (text, command) tuples."""
-        for text, command in buttons:
+        for text, attr in _SIDEBAR_SPECS.get(self.current_role, _SIDEBAR_SPECS[Role.STUDENT]):
             ttk.Button(self.sidebar_frame, text=text, style='Secondary.TButton',
-                      command=command, width=20).pack(fill='x', padx=5, pady=2)
+                      command=getattr(self, attr), width=20).pack(fill='x', padx=5, pady=2)
     
     def show_admin_interface(self) -> None:
         """Show admin interface."""
         self.show_admin_dashboard()
     
-    def show_admin_dashboard(self) -> None:
-        """Show admin dashboard with statistics and recent activities"""
-        self.clear_content_frame()
-    
-        ttk.Label(self.content_frame, text="Administrator Dashboard", 
-                 style='Title.TLabel').pack(pady=10)
-    
-        # Load activities
-        try:
-            activities = self.data_manager.get_recent_activities()
-            for activity in activities[-10:]:
-                activity_tree.insert('', 'end', values=(
-                    activity.get('timestamp', '')[:16],
-                    activity.get('type', ''),
-                    activity.get('description', '')
-                ))
-        except Exception as e:
-            print(f"Error retrieving recent activities: {e}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", "Unable to display recent activities.")
-    
-        # Display activities in the Treeview
-        for activity in activities:
-            self.activity_tree.insert('', 'end', values=(
-                activity.get('timestamp', '')[:8],  # Just the time
-                activity.get('type', 'Unknown'),
-                activity.get('message', '')
-            ))
-
     def show_buildings_management(self) -> None:
         """Show buildings management interface."""
         self.clear_content_frame()
@@ -501,24 +668,30 @@ class CleaningManagementApp:
         for col in columns:
             buildings_tree.heading(col, text=col)
             buildings_tree.column(col, width=100)
+        buildings_tree.column('ID', width=60, stretch=False)
+        buildings_tree.tag_configure('active', background='white')
     
         scrollbar = ttk.Scrollbar(list_frame, orient='vertical', command=buildings_tree.yview)
-        buildings_tree.configure(yscrollcommand=scrollbar.set)
         buildings_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
     
-        for building in self.data_manager.buildings.values():
-            chief_name = self.data_manager.users.get(building.chief_id, {}).get('name', 'Not assigned') if building.chief_id else 'Not assigned'
-            occupancy_rate = f"{building.get_occupancy_rate()*100:.1f}%"
-        
-            buildings_tree.insert('', 'end', values=(
+        # Rows are formatted only when their batch scrolls into view
+        chief_names = {uid: u.get('name', 'Not assigned') for uid, u in self.data_manager.users.items()}
+
+        def format_building_row(building):
+            chief_name = chief_names.get(building.chief_id, 'Not assigned') if building.chief_id else 'Not assigned'
+            return (
                 building.id,
                 building.name,
                 chief_name,
                 len(building.students),
-                occupancy_rate,
+                f"{building.get_occupancy_rate()*100:.1f}%",
                 "Active"
-            ))
+            )
+
+        self._building_source = list(self.data_manager.buildings.values())
+        self._buildings_lazy_tree = LazyTreeview(buildings_tree, scrollbar, self._building_source,
+                                                 tags=('active',), format_row=format_building_row)
     
         # Declare buildings_tree as an instance attribute for access in the function
         self.buildings_tree = buildings_tree
@@ -531,7 +704,7 @@ class CleaningManagementApp:
                 context_menu = tk.Menu(self.root, tearoff=0)
             
                 # Only for building chiefs, not for admins
-                if self.current_role != USER_ROLES['ADMIN']:
+                if self.current_role != Role.ADMIN:
                     context_menu.add_command(label="Edit", 
                                            command=lambda: self.edit_building(building_id))
             
@@ -569,8 +742,7 @@ class CleaningManagementApp:
         id_entry = ttk.Entry(dialog, font=('Segoe UI', 10), width=25)
         id_entry.pack(pady=(0, 10))
         
-        max_id = max(self.data_manager.buildings.keys(), default=0)
-        id_entry.insert(0, str(max_id + 1))
+        id_entry.insert(0, str(self.data_manager.next_building_id))
         
         button_frame = ttk.Frame(dialog)
         button_frame.pack(pady=20)
@@ -621,7 +793,7 @@ class CleaningManagementApp:
         """Show building dashboard for chief."""
         self.clear_content_frame()
         
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned", 
                      style='Title.TLabel').pack(pady=50)
@@ -633,13 +805,12 @@ class CleaningManagementApp:
         stats_frame = ttk.Frame(self.content_frame)
         stats_frame.pack(fill='x', padx=20, pady=10)
         
-        building_students = [s for s in self.data_manager.students.values() 
-                           if s.building_id == building.id]
+        building_students = self.data_manager.students_by_building.get(building.id, {})
         
         stats = [
             ("Students", len(building_students)),
-            ("Active Groups", len([g for g in self.data_manager.groups.values() 
-                                  if g.building_id == building.id and g.active])),
+            ("Active Groups", sum(1 for g in self.data_manager.groups_by_building.get(building.id, {}).values()
+                                  if g.active)),
             ("Occupancy Rate", f"{building.get_occupancy_rate()*100:.1f}%"),
             ("Performance", "85%")
         ]
@@ -671,57 +842,59 @@ class CleaningManagementApp:
         self.clear_content_frame()
     
         # Reload data
-        self.data_manager.load_students()
-        self.data_manager.load_buildings()
+        self.data_manager.load_files('students.json', 'buildings.json')
     
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned").pack(pady=50)
             return
     
         # Get students in the building
-        building_students = [s for s in self.data_manager.students.values() 
-                           if s.building_id == building.id]
+        building_students = self.data_manager.get_students_by_building(building.id)
     
         if not building_students:
             ttk.Label(self.content_frame, text="No students registered").pack(pady=50)
             return
     
         # Create Treeview
+        tree_frame = ttk.Frame(self.content_frame)
+        tree_frame.pack(fill='both', expand=True, padx=10, pady=10)
+    
         columns = ('ID', 'Name', 'Block', 'Room', 'Phone', 'Email')
-        tree = ttk.Treeview(self.content_frame, columns=columns, show='headings')
+        tree = ttk.Treeview(tree_frame, columns=columns, show='headings')
     
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=100)
     
-        # Add data
-        for student in building_students:
-            tree.insert('', 'end', values=(
+        scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=tree.yview)
+        tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+    
+        # Rows are inserted as they scroll into view; item ids are the student ids
+        self._students_lazy_tree = LazyTreeview(
+            tree, scrollbar, building_students,
+            format_row=lambda student: (
                 student.id,
                 student.name,
                 student.block,
                 student.room_number,
                 student.phone or '',
                 student.email or ''
-            ))
+            ),
+            key=attrgetter('id'))
     
-        tree.pack(fill='both', expand=True, padx=10, pady=10)
+        # Add context menu for deleting a student (built once, retargeted per click)
+        if self._student_ctx_menu is None:
+            self._student_ctx_menu = tk.Menu(self.root, tearoff=0)
+            self._student_ctx_menu.add_command(label="Delete")
     
-        # Add context menu for deleting a student
         def on_student_right_click(event):
             try:
-                item = tree.selection()[0]
-                student_id = tree.item(item, 'values')[0]
-            
-                context_menu = tk.Menu(self.root, tearoff=0)
-                context_menu.add_command(
-                    label="Delete", 
-                    command=lambda: self.delete_student(student_id)
-                )
-            
-                context_menu.tk_popup(event.x_root, event.y_root)
-                context_menu.grab_release()
+                student_id = tree.selection()[0]
+                self._student_ctx_menu.entryconfigure(
+                    0, command=lambda: self.delete_student(student_id))
+                self._student_ctx_menu.tk_popup(event.x_root, event.y_root)
             except IndexError:
                 pass
     
@@ -729,7 +902,7 @@ class CleaningManagementApp:
 
     def show_add_student_dialog(self) -> None:
         """Show dialog to add a new student."""
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             messagebox.showerror("Error", "No building assigned.")
             return
@@ -763,13 +936,20 @@ class CleaningManagementApp:
                                  font=('Segoe UI', 10), width=22, state='readonly')
         room_combo.pack(pady=(0, 10))
         
+        # Room occupancy is counted once per dialog; free rooms are cached per block
+        occupied = Counter((s.block, s.room_number)
+                           for s in self.data_manager.get_students_by_building(building.id))
+        available_by_block = {}
+        
         def on_block_change(event):
             selected_block = block_var.get()
             if selected_block:
-                available_rooms = building.get_available_rooms(
-                    selected_block, 
-                    {s.id: s.to_dict() for s in self.data_manager.students.values()}
-                )
+                available_rooms = available_by_block.get(selected_block)
+                if available_rooms is None:
+                    available_rooms = available_by_block[selected_block] = [
+                        room for room in range(1, building.rooms_per_block + 1)
+                        if occupied[(selected_block, room)] < building.people_per_room
+                    ]
                 room_combo['values'] = available_rooms
         
         block_combo.bind('<<ComboboxSelected>>', on_block_change)
@@ -802,7 +982,8 @@ class CleaningManagementApp:
                 messagebox.showerror("Error", "The room number must be a number.")
                 return
             
-            student_id = f"{building.id}_{block}{room_number}_{len(self.data_manager.students) + 1}"
+            seq = self.data_manager.next_student_seq(building.id)
+            student_id = f"{building.id}_{block}{room_number}_{seq}"
             student = Student(
                 id=student_id,
                 name=name,
@@ -844,21 +1025,19 @@ class CleaningManagementApp:
 
     def create_cleaning_groups(self) -> None:
         """Create cleaning groups for the chief's building."""
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             messagebox.showerror("Error", "No building assigned.")
             return
         
-        building_students = [s for s in self.data_manager.students.values() 
-                           if s.building_id == building.id]
+        building_students = self.data_manager.students_by_building.get(building.id, {})
         
         if len(building_students) < 2:
             messagebox.showwarning("Warning", "At least 2 students are required to create groups.")
             return
         
         # Check if groups already exist for this building
-        existing_groups = [g for g in self.data_manager.groups.values() 
-                          if g.building_id == building.id]
+        existing_groups = self.data_manager.get_groups_by_building(building.id)
         
         if existing_groups:
             response = messagebox.askyesno("Existing Groups", 
@@ -866,33 +1045,39 @@ class CleaningManagementApp:
                                          "Do you want to delete the existing groups and create new ones?")
             if response:
                 # Delete existing groups
-                for group in existing_groups:
-                    self.data_manager.remove_group(group.id)
+                with self.data_manager.batch():
+                    for group in existing_groups:
+                        self.data_manager.remove_group(group.id)
             else:
                 return
         
+        # Bucket students by block in a single pass
+        students_by_block = defaultdict(list)
+        for student in building_students.values():
+            students_by_block[student.block].append(student)
+        
         groups_created = 0
-        for block in building.blocks:
-            block_students = [s for s in building_students if s.block == block]
-            
-            if len(block_students) >= 2:
-                group_size = 4
-                for i in range(0, len(block_students), group_size):
-                    group_members = block_students[i:i + group_size]
-                    group_id = f"building_{building.id}_block_{block}_group_{groups_created + 1}"
-                    group_name = f"Group {block}{groups_created + 1} - {building.name}"
+        with self.data_manager.batch():
+            for block in building.blocks:
+                block_students = students_by_block.get(block, ())
+            
+                if len(block_students) >= 2:
+                    group_size = building.group_formation_rules.get('group_size', 4)
+                    for group_members in self.scheduler.partition_students(block_students, group_size):
+                        group_id = f"building_{building.id}_block_{block}_group_{groups_created + 1}"
+                        group_name = f"Group {block}{groups_created + 1} - {building.name}"
                     
-                    group = CleaningGroup(
-                        id=group_id,
-                        name=group_name,
-                        building_id=building.id,
-                        members=[s.id for s in group_members],
-                        assigned_areas=building.custom_cleaning_areas,
-                        block_restriction=block
-                    )
+                        group = CleaningGroup(
+                            id=group_id,
+                            name=group_name,
+                            building_id=building.id,
+                            members=[s.id for s in group_members],
+                            assigned_areas=building.custom_cleaning_areas,
+                            block_restriction=block
+                        )
                     
-                    if self.data_manager.add_group(group):
-                        groups_created += 1
+                        if self.data_manager.add_group(group):
+                            groups_created += 1
         
         if groups_created > 0:
             messagebox.showinfo("Success", f"{groups_created} group(s) created successfully!")
@@ -904,7 +1089,7 @@ class CleaningManagementApp:
         """Show groups management interface."""
         self.clear_content_frame()
         
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned", 
                      style='Title.TLabel').pack(pady=50)
@@ -926,7 +1111,7 @@ class CleaningManagementApp:
         
         ttk.Button(controls_frame, text="🔄 Refresh", 
                   style='Secondary.TButton',
-                  command=self.show_groups_management).pack(side='left', padx=5)
+                  command=self._refresh_groups_debounced).pack(side='left', padx=5)
         
         list_frame = ttk.LabelFrame(self.content_frame, text="Active Groups", padding=10)
         list_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -942,8 +1127,7 @@ class CleaningManagementApp:
         groups_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
-        building_groups = [g for g in self.data_manager.groups.values() 
-                         if g.building_id == building.id]
+        building_groups = self.data_manager.get_groups_by_building(building.id)
         
         for group in building_groups:
             performance = group.get_performance_summary()
@@ -958,13 +1142,12 @@ class CleaningManagementApp:
     
     def delete_all_groups(self) -> None:
         """Delete all groups for the chief's building."""
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             messagebox.showerror("Error", "No building assigned.")
             return
         
-        building_groups = [g for g in self.data_manager.groups.values() 
-                          if g.building_id == building.id]
+        building_groups = self.data_manager.get_groups_by_building(building.id)
         
         if not building_groups:
             messagebox.showinfo("Information", "No groups to delete.")
@@ -977,9 +1160,10 @@ class CleaningManagementApp:
         
         if response:
             deleted_count = 0
-            for group in building_groups:
-                if self.data_manager.remove_group(group.id):
-                    deleted_count += 1
+            with self.data_manager.batch():
+                for group in building_groups:
+                    if self.data_manager.remove_group(group.id):
+                        deleted_count += 1
             
             if deleted_count > 0:
                 messagebox.showinfo("Success", f"{deleted_count} group(s) deleted successfully!")
@@ -991,7 +1175,7 @@ class CleaningManagementApp:
         """Show weekly schedule for chief's building."""
         self.clear_content_frame()
         
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned", 
                      style='Title.TLabel').pack(pady=50)
@@ -1032,40 +1216,36 @@ class CleaningManagementApp:
         days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         start_date = datetime.now()
         
+        # The (at most two) groups shown are the same every day; resolve them once
+        students = self.data_manager.students
+        shown_groups = []
+        for group in self.data_manager.groups_by_building.get(building.id, {}).values():
+            if not group.active:
+                continue
+            member_names = ', '.join(students[member_id].name
+                                     for member_id in group.members[:2] if member_id in students)
+            areas = group.assigned_areas[:2] if group.assigned_areas else ['Corridors']
+            shown_groups.append((group.name, areas, member_names))
+            if len(shown_groups) == 2:
+                break
+        
+        rows = []
         for i, day in enumerate(days):
-            current_date = start_date + timedelta(days=i)
-            date_str = current_date.strftime('%d/%m')
-            
-            groups = [g for g in self.data_manager.groups.values() 
-                     if g.building_id == building.id and g.active]
-            
-            for j, group in enumerate(groups[:2]):
-                areas = group.assigned_areas[:2] if group.assigned_areas else ['Corridors']
+            date_str = (start_date + timedelta(days=i)).strftime('%d/%m')
+            for group_name, areas, member_names in shown_groups:
                 for area in areas:
-                    member_names = [
-                        self.data_manager.students[member_id].name 
-                        for member_id in group.members[:2] 
-                        if member_id in self.data_manager.students
-                    ]
-                    schedule_tree.insert('', 'end', values=(
-                        day,
-                        date_str,
-                        group.name,
-                        area,
-                        ', '.join(member_names),
-                        '08:00-09:00',
-                        'Scheduled'
-                    ))
+                    rows.append((day, date_str, group_name, area, member_names,
+                                 '08:00-09:00', 'Scheduled'))
+        insert_tree_rows(schedule_tree, rows)
     
     def update_building_schedule(self) -> None:
         """Update schedule for chief's building."""
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             return
         
         try:
-            building_groups = {g.id: g for g in self.data_manager.groups.values() 
-                             if g.building_id == building.id}
+            building_groups = dict(self.data_manager.groups_by_building.get(building.id, {}))
             
             if not building_groups:
                 messagebox.showwarning("Warning", "No cleaning groups found. Create groups first.")
@@ -1088,29 +1268,33 @@ class CleaningManagementApp:
             messagebox.showinfo("Success", "Schedule updated successfully!")
             self.show_weekly_schedule()
         except Exception as e:
-            print(f"Error updating the schedule: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Error updating the schedule")
             messagebox.showerror("Error", f"Error updating the schedule: {str(e)}")
     
     def export_building_schedule(self) -> None:
         """Export building schedule to CSV."""
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             return
         
+        # Deep copy taken on the Tk thread, which keeps changing the live objects meanwhile
+        args = copy.deepcopy(({building.id: building.current_schedule},
+                              self.data_manager.buildings, self.data_manager.students))
+        
+        # The CSV is written on a worker thread; the result is reported back on the Tk thread
+        self._run_in_background(lambda: self.exporter.export_weekly_schedule_to_csv(*args),
+                                self._on_schedule_exported)
+    
+    def _on_schedule_exported(self, future: Future) -> None:
+        """Report the outcome of a background schedule export."""
         try:
-            building_schedule = {building.id: building.current_schedule}
-            filepath = self.exporter.export_weekly_schedule_to_csv(
-                building_schedule,
-                self.data_manager.buildings,
-                self.data_manager.students
-            )
-            
+            filepath = future.result()
             if filepath:
                 messagebox.showinfo("Success", f"Schedule exported to:\n{filepath}")
             else:
                 messagebox.showerror("Error", "Error exporting the schedule.")
         except Exception as e:
-            print(f"Error during export: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Error during schedule export")
             messagebox.showerror("Error", f"Error during export: {str(e)}")
     
     def show_tasks_tracking(self) -> None:
@@ -1122,11 +1306,17 @@ class CleaningManagementApp:
                  style='Title.TLabel').pack(pady=10)
     
         # Get the chief's building
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned").pack(pady=50)
             return
     
+        controls_frame = ttk.Frame(self.content_frame)
+        controls_frame.pack(fill='x', padx=10)
+        ttk.Button(controls_frame, text="✅ Validate Selected", 
+                  style='Primary.TButton',
+                  command=self.validate_selected_tasks).pack(side='left', padx=5)
+    
         # Frame for the Treeview
         tree_frame = ttk.Frame(self.content_frame)
         tree_frame.pack(fill='both', expand=True, padx=10, pady=10)
@@ -1166,59 +1356,96 @@ class CleaningManagementApp:
             self.tasks_tree.delete(item)
 
         today = datetime.now().date()
+        # Only tasks from a week ago up to two weeks ahead are listed
+        window_lo = (today - timedelta(days=7)).isoformat()
+        window_hi = (today + timedelta(days=14)).isoformat()
         all_tasks = []
+        id_to_name = {sid: s.name for sid, s in self.data_manager.students.items()}
 
-        groups_in_building = sorted([g for g in self.data_manager.groups.values() if g.building_id == building.id], key=lambda g: g.name)
+        groups_in_building = sorted(self.data_manager.get_groups_by_building(building.id), key=lambda g: g.name)
 
         for group in groups_in_building:
         
             # If no schedule exists, display tasks as "Not scheduled"
             if not group.rotation_schedule:
+                member_names = group.get_member_names(self.data_manager.students) or "No members"
                 for area in sorted(group.assigned_areas):
-                    member_names = [self.data_manager.students[m_id].name for m_id in group.members if m_id in self.data_manager.students]
                     task_data = {
-                        'values': ["", "TODAY", group.name, area, ", ".join(member_names) if member_names else "No members", "Not scheduled", "N/A"],
-                        'tags': (f"{group.id}::default::{area}", 'pending'),
+                        'iid': f"{group.id}::default::{area}",
+                        'values': ["", "TODAY", group.name, area, member_names, "Not scheduled", "N/A"],
+                        'tags': ('pending',),
                         'sort_key': (group.name, area)
                     }
                     all_tasks.append(task_data)
                 continue
             
-            # If a schedule exists, display corresponding tasks
-            for date_str, schedule in sorted(group.rotation_schedule.items()):
+            # If a schedule exists, display corresponding tasks (dates are stored in order)
+            for date_str, schedule in group.rotation_schedule.items():
+                day = date_str[:10]
+                if day < window_lo:
+                    continue
+                if day > window_hi:
+                    break
                 try:
-                    task_date = datetime.fromisoformat(date_str).date()
+                    task_date = date.fromisoformat(day)
                     is_today = task_date == today
                 except (ValueError, TypeError):
                     continue
             
                 display_date = "TODAY" if is_today else task_date.strftime("%d/%m/%Y")
-            
-                assigned_members_map = schedule.get('assigned_members', {})
-                areas = sorted(assigned_members_map.keys() if assigned_members_map else group.assigned_areas)
 
-                for area in areas:
-                    is_completed = schedule.get('status') == 'completed'
-                    members = assigned_members_map.get(area, group.members)
-                    member_names = [self.data_manager.students[m_id].name for m_id in members if m_id in self.data_manager.students]
-                
-                    status_text = "Completed" if is_completed else "To do" if is_today else "Scheduled"
-                    quality_text = self.get_quality_stars(group, date_str, area) if is_completed else "N/A"
-                
-                    values = ["✓" if is_completed else "", display_date, group.name, area, ", ".join(member_names) if member_names else "No members", status_text, quality_text]
-                
-                    task_id = f"{group.id}::{date_str}::{area}"
-                    tags = ('completable' if is_today and not is_completed else 'completed' if is_completed else 'pending')
-                
+                for iid, values, tags in self._scheduled_task_rows(group, date_str, schedule,
+                                                                   display_date, is_today, id_to_name):
                     task_data = {
+                        'iid': iid,
                         'values': values,
-                        'tags': (task_id, tags)
+                        'tags': tags
                     }
                     all_tasks.append(task_data)
 
-        # Insert sorted tasks into the Treeview
+        # Insert sorted tasks into the Treeview; the task id is the item id
+        tree_insert = self.tasks_tree.insert
         for task in all_tasks:
-            self.tasks_tree.insert('', 'end', values=task['values'], tags=task['tags'])
+            tree_insert('', 'end', iid=task['iid'], values=task['values'], tags=task['tags'])
+
+    def _scheduled_task_rows(self, group, date_str: str, schedule: dict,
+                             display_date: str, is_today: bool, id_to_name: dict):
+        """Yield (task id, values, tags) for each area row of one scheduled date of a group."""
+        # Everything except the area and its members is the same for the whole date
+        assigned = schedule.get('assigned_members') or {}
+        areas = sorted(assigned) if assigned else sorted(group.assigned_areas)
+        is_completed = schedule.get('status') == 'completed'
+        group_name = group.name
+        task_prefix = f"{group.id}::{date_str}::"
+    
+        done_mark = "✓" if is_completed else ""
+        status_text = "Completed" if is_completed else "To do" if is_today else "Scheduled"
+        quality_text = self.get_quality_stars(group, date_str, None) if is_completed else "N/A"
+        tag = 'completable' if is_today and not is_completed else 'completed' if is_completed else 'pending'
+    
+        for area in areas:
+            members = assigned.get(area)
+            if members is None:
+                member_names = group.get_member_names(self.data_manager.students)
+            else:
+                member_names = ", ".join(id_to_name[m_id] for m_id in members if m_id in id_to_name)
+            values = [done_mark, display_date, group_name, area, member_names or "No members", status_text, quality_text]
+            yield task_prefix + area, values, (tag,)
+
+    def _refresh_task_rows(self, group, date_str: str) -> None:
+        """Update in place the task rows of one group and date after a change."""
+        schedule = group.rotation_schedule.get(date_str, {})
+        task_date = date.fromisoformat(date_str[:10])
+        is_today = task_date == datetime.now().date()
+        display_date = "TODAY" if is_today else task_date.strftime("%d/%m/%Y")
+        students = self.data_manager.students
+        id_to_name = {m_id: students[m_id].name
+                      for m_id in chain(group.members, *schedule.get('assigned_members', {}).values())
+                      if m_id in students}
+        for iid, values, tags in self._scheduled_task_rows(group, date_str, schedule,
+                                                           display_date, is_today, id_to_name):
+            if self.tasks_tree.exists(iid):
+                self.tasks_tree.item(iid, values=values, tags=tags)
 
     def on_task_right_click(self, event):
         """Handle right-click on a task to show context menu."""
@@ -1228,44 +1455,57 @@ class CleaningManagementApp:
                 return
 
             self.tasks_tree.selection_set(item)
-            tags = self.tasks_tree.item(item, 'tags')
-            task_id = tags[0]
+            task_id = item
             
             # Check if the task is already completed
-            is_completed = 'completed' in tags
+            is_completed = self.tasks_tree.tag_has('completed', item)
             
-            context_menu = tk.Menu(self.root, tearoff=0)
+            # The menu is built once; only its first entry changes per task
+            context_menu = self._task_ctx_menu
+            if context_menu is None:
+                context_menu = self._task_ctx_menu = tk.Menu(self.root, tearoff=0)
+                context_menu.add_command(label="✅ Validate Task")
+                context_menu.add_separator()
+                context_menu.add_command(label="View Student Details") # To be implemented
             
             if not is_completed:
-                context_menu.add_command(label="✅ Validate Task",
-                                       command=lambda: self.validate_task(task_id))
+                context_menu.entryconfigure(0, label="✅ Validate Task",
+                                            command=lambda: self.validate_task(task_id))
             else:
-                context_menu.add_command(label="✏️ Edit Quality",
-                                       command=lambda: self.validate_task(task_id, is_editing=True))
-            
-            context_menu.add_separator()
-            context_menu.add_command(label="View Student Details") # To be implemented
+                context_menu.entryconfigure(0, label="✏️ Edit Quality",
+                                            command=lambda: self.validate_task(task_id, is_editing=True))
             
             context_menu.tk_popup(event.x_root, event.y_root)
         except IndexError:
             pass # Click in empty space
 
-    def validate_task(self, task_id: str, is_editing: bool = False):
-        """Validate a task and assign a quality score."""
+    def validate_task(self, task_id: str, is_editing: bool = False,
+                      on_done: Optional[Callable[[bool], None]] = None):
+        """Validate a task and assign a quality score.
+
+        The quality dialog does not block; on_done (if given) gets True once the task
+        is saved, or False if the dialog was closed or the validation failed.
+        """
+        def fail(message):
+            messagebox.showerror("Error", message)
+            if on_done is not None:
+                on_done(False)
+
         try:
             parts = task_id.split('::')
             if len(parts) != 3:
-                messagebox.showerror("Error", "Invalid task format.")
+                fail("Invalid task format.")
                 return
                 
             group_id, date_str, area = parts
             group = self.data_manager.groups.get(group_id)
             if not group:
-                messagebox.showerror("Error", "Group not found.")
+                fail("Group not found.")
                 return
 
             # Handle the case where there is no schedule (default task)
-            if date_str == 'default':
+            was_default = date_str == 'default'
+            if was_default:
                 # Create a schedule for today
                 today = datetime.now().date().isoformat()
                 if today not in group.rotation_schedule:
@@ -1277,16 +1517,29 @@ class CleaningManagementApp:
                 date_str = today
 
             if date_str not in group.rotation_schedule:
-                messagebox.showerror("Error", "Schedule not found for this date.")
+                fail("Schedule not found for this date.")
                 return
 
             schedule = group.rotation_schedule[date_str]
             
-            initial_quality = schedule.get('quality_score', 5)
-            quality = self.ask_task_quality(initial_quality)
-            if quality is None:
-                return
+            def on_quality(quality):
+                if quality is not None:
+                    self._apply_task_quality(group, date_str, area, quality, was_default, on_done)
+                elif on_done is not None:
+                    on_done(False)
+
+            self.ask_task_quality_async(schedule.get('quality_score', 5), on_quality)
+
+        except Exception as e:
+            logger.exception("Error during validation")
+            fail(f"Error during validation: {e}")
 
+    def _apply_task_quality(self, group, date_str: str, area: str, quality: int,
+                            was_default: bool, on_done: Optional[Callable[[bool], None]]) -> None:
+        """Record a task's quality score, notify, award badges and update the task rows."""
+        group_id = group.id
+        try:
+            schedule = group.rotation_schedule[date_str]
             schedule['status'] = 'completed'
             schedule['quality_score'] = quality
             
@@ -1314,23 +1567,63 @@ class CleaningManagementApp:
             # Send notifications
             self.data_manager.add_task_completion_notification(task_info, quality)
             
-            # Award badges based on quality
-            if quality >= 4: # Good or excellent work
-                for student_id in assigned_members:
-                    if student_id in self.data_manager.students:
-                        student = self.data_manager.students[student_id]
-                        # This method should be adapted or simplified if it depends on performance
-                        self.data_manager.check_and_award_badges(student)
+            # Record the task against the group and its members, and award badges on
+            # good work; the student and group files are written once at the end
+            with self.data_manager.batch():
+                self.data_manager.record_task_completion(group, date_str, area, assigned_members, quality)
+                if quality >= 4: # Good or excellent work
+                    for student_id in assigned_members:
+                        if student_id in self.data_manager.students:
+                            student = self.data_manager.students[student_id]
+                            self.data_manager.check_and_award_badges(student)
 
-            self.data_manager.save_groups()
-            self.data_manager.save_students()
+                self.data_manager.save_groups()
+                self.data_manager.save_students()
             
-            messagebox.showinfo("Success", "Task updated successfully!")
-            self.populate_tasks_tree(self.data_manager.get_building_by_chief(self.current_user['username']))
+            if on_done is None:
+                messagebox.showinfo("Success", "Task updated successfully!")
+            if was_default:
+                # The default rows are replaced by dated ones, so rebuild the list
+                self.populate_tasks_tree(self._current_building())
+            else:
+                self._refresh_task_rows(group, date_str)
+            if on_done is not None:
+                on_done(True)
 
         except Exception as e:
-            print(f"Error during validation: {e}\n{traceback.format_exc()}")
+            logger.exception("Error during validation")
             messagebox.showerror("Error", f"Error during validation: {e}")
+            if on_done is not None:
+                on_done(False)
+
+    def validate_selected_tasks(self) -> None:
+        """Validate the selected pending tasks, one quality dialog after the other.
+
+        Closing a dialog (or an error) stops the remaining tasks; the summary says how far it got.
+        """
+        pending = [item for item in self.tasks_tree.selection()
+                   if not self.tasks_tree.tag_has('completed', item)]
+        if not pending:
+            messagebox.showinfo("Information", "Select one or more tasks to validate.")
+            return
+        total = len(pending)
+        validated = 0
+
+        def next_task(ok: bool = True):
+            if ok and pending:
+                self.validate_task(pending.pop(0), on_done=on_task_done)
+            elif validated == total:
+                messagebox.showinfo("Success", f"{total} task(s) validated successfully!")
+            else:
+                messagebox.showinfo("Information", f"Validated {validated} of {total} task(s).")
+
+        def on_task_done(ok: bool):
+            nonlocal validated
+            if ok:
+                validated += 1
+            next_task(ok)
+
+        next_task()
 
     def get_quality_stars(self, group, date_str, area):
         """Get the quality score as a string of stars."""
@@ -1345,8 +1638,9 @@ class CleaningManagementApp:
                         return "N/A"
         return "N/A"
 
-    def ask_task_quality(self, initial_quality):
-        """Display a dialog box to evaluate quality"""
+    def ask_task_quality_async(self, initial_quality: int,
+                               on_result: Callable[[Optional[int]], None]) -> None:
+        """Display a dialog box to evaluate quality; on_result gets the score (None if closed)."""
         dialog = tk.Toplevel(self.root)
         dialog.title("Quality Evaluation")
         dialog.transient(self.root)
@@ -1361,15 +1655,13 @@ class CleaningManagementApp:
             ttk.Radiobutton(dialog, text="⭐" * i, variable=quality_var, 
                            value=i).pack(anchor='w', padx=20)
     
-        def confirm():
-            dialog.quality_result = quality_var.get()
+        def finish(result):
             dialog.destroy()
+            on_result(result)
     
-        ttk.Button(dialog, text="Validate", command=confirm).pack(pady=10)
-    
-        dialog.quality_result = None
-        dialog.wait_window()
-        return dialog.quality_result
+        ttk.Button(dialog, text="Validate",
+                   command=lambda: finish(quality_var.get())).pack(pady=10)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: finish(None))
 
     def show_notifications(self) -> None:
         """Show enhanced notifications interface for chief."""
@@ -1382,8 +1674,9 @@ class CleaningManagementApp:
         stats_frame = ttk.Frame(self.content_frame)
         stats_frame.pack(fill='x', padx=20, pady=5)
         
-        unread_count = self.data_manager.get_unread_notifications_count(self.current_user['username'])
-        total_count = len(self.data_manager.get_notifications_for_user(self.current_user['username']))
+        username = self.current_user['username']
+        total_count = len(self.data_manager.query_notifications(username))
+        unread_count = len(self.data_manager.query_notifications(username, read=False))
         
         ttk.Label(stats_frame, text=f"📬 {total_count} total notifications", 
                  style='Info.TLabel').pack(side='left')
@@ -1401,14 +1694,14 @@ class CleaningManagementApp:
 
         ttk.Button(controls_frame, text="🔄 Refresh", 
                   style='Secondary.TButton',
-                  command=self.refresh_notifications).pack(side='left', padx=5)
+                  command=self._refresh_notifications_debounced).pack(side='left', padx=5)
 
         ttk.Button(controls_frame, text="🗑️ Delete Selected", 
                   style='Error.TButton',
                   command=self.delete_selected_notification).pack(side='left', padx=5)
 
         # Button to create a notification (chiefs only)
-        if self.current_user['role'] == 'chief':
+        if self.current_role == Role.CHIEF:
             ttk.Button(controls_frame, text="📝 New Announcement", 
                       style='Primary.TButton',
                       command=self.create_notification).pack(side='right', padx=5)
@@ -1465,12 +1758,13 @@ class CleaningManagementApp:
         notif_tree.tag_configure('public', background='#e7f3ff')
 
         scrollbar = ttk.Scrollbar(notif_frame, orient='vertical', command=notif_tree.yview)
-        notif_tree.configure(yscrollcommand=scrollbar.set)
         notif_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
         # Store the treeview as an attribute
         self.notifications_tree = notif_tree
+        self._notifications_scrollbar = scrollbar
+        self._last_notif_sig = None
 
         # Load notifications
         self.refresh_notifications()
@@ -1481,13 +1775,13 @@ class CleaningManagementApp:
 
     def apply_notification_filters(self):
         """Apply notification filters."""
-        self.refresh_notifications()
+        self._refresh_notifications_debounced()
 
     def mark_all_notifications_read(self):
         """Mark all notifications as read."""
         try:
             self.data_manager.mark_all_notifications_read(self.current_user['username'])
-            self.refresh_notifications()
+            self._refresh_notifications_debounced()
             messagebox.showinfo("Success", "All notifications have been marked as read.")
         except Exception as e:
             print(f"Error during marking: {str(e)}\n{traceback.format_exc()}")
@@ -1496,35 +1790,48 @@ class CleaningManagementApp:
     def on_notification_click(self, event):
         """Handle single click on notification to mark as read."""
         try:
-            selection = self.notifications_tree.selection()
-            if not selection:
+            # Rows are keyed by notification id
+            notification_id = self.notifications_tree.identify_row(event.y)
+            if not notification_id:
                 return
-
-            item = selection[0]
-            notification_id = self.notifications_tree.item(item, 'tags')[0]
             
             # Mark as read if not already done
-            notification = None
-            for n in self.data_manager.notifications:
-                if n.get('id') == notification_id:
-                    notification = n
-                    break
-            
-            if notification and not notification.get('read', False):
+            notification = self.data_manager.get_notification(notification_id)
+            if notification and not notification.read:
                 self.data_manager.mark_notification_read(notification_id)
-                self.refresh_notifications()
+                self._update_notification_row(notification)
+                self._schedule_notifications_flush()
         except Exception as e:
             print(f"Error during click: {str(e)}")
 
     def create_notification(self):
         """Create a new notification (for chiefs)."""
+        if self._create_notif_dialog is None or not self._create_notif_dialog.winfo_exists():
+            self._create_notif_dialog = self._build_create_notification_dialog()
+        dialog = self._create_notif_dialog
+
+        # Start from an empty form
+        dialog.type_var.set('INFO')
+        dialog.public_var.set(True)
+        dialog.message_text.delete('1.0', 'end')
+
+        self._center_window(dialog, 500, 400)
+        dialog.deiconify()
+        dialog.grab_set()
+        dialog.message_text.focus_set()
+
+    def _build_create_notification_dialog(self) -> tk.Toplevel:
+        """Build the (hidden) announcement dialog; create_notification shows it."""
         dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.title("Create an Announcement")
-        dialog.geometry("500x400")
         dialog.transient(self.root)
-        dialog.grab_set()
-        
-        self._center_window(dialog, 500, 400)
+
+        def close():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        dialog.protocol("WM_DELETE_WINDOW", close)
 
         main_frame = ttk.Frame(dialog, padding="20")
         main_frame.pack(fill='both', expand=True)
@@ -1567,102 +1874,105 @@ class CleaningManagementApp:
                 self.data_manager.add_notification(message, notif_type, self.current_user['username'])
             
             messagebox.showinfo("Success", "Announcement created successfully!")
-            dialog.destroy()
-            self.refresh_notifications()
+            close()
+            self._refresh_notifications_debounced()
         
         # Buttons
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill='x', pady=(20, 0))
         
         ttk.Button(button_frame, text="Cancel", 
-                  command=dialog.destroy).pack(side='right', padx=(5, 0))
+                  command=close).pack(side='right', padx=(5, 0))
         ttk.Button(button_frame, text="Create", 
                   command=validate_and_save, style='Accent.TButton').pack(side='right')
 
+        # Form state, reset by create_notification on each use
+        dialog.type_var = type_var
+        dialog.public_var = public_var
+        dialog.message_text = message_text
+        return dialog
+
+    def _notifications_signature(self) -> tuple:
+        """Everything the notification list depends on: user, filters and data version."""
+        return (self.current_user['username'], self.filter_type_var.get(),
+                self.filter_status_var.get(), self.data_manager.notifications_version)
+
     def refresh_notifications(self) -> None:
         """Refresh the notifications list with filters and enhanced display."""
-        if hasattr(self, 'notifications_tree'):
+        # Only while the notifications view is the one on screen
+        if hasattr(self, 'notifications_tree') and self.notifications_tree.winfo_exists():
+            # Nothing to do if neither the filters nor the notifications changed
+            signature = self._notifications_signature()
+            if signature == self._last_notif_sig:
+                return
+            self._last_notif_sig = signature
+
             # Clear the treeview
-            for item in self.notifications_tree.get_children():
-                self.notifications_tree.delete(item)
+            self.notifications_tree.delete(*self.notifications_tree.get_children())
+
+            # Filtering and sorting (most recent first) are done and cached by the data manager
+            filter_type = self.filter_type_var.get()
+            filter_status = self.filter_status_var.get()
+            filtered_notifications = self.data_manager.query_notifications(
+                self.current_user['username'],
+                notification_type=None if filter_type == "All" else filter_type,
+                read={"All": None, "Unread": False, "Read": True}.get(filter_status))
+
+            # Rows are formatted and inserted a batch at a time as the list is scrolled
+            self._notifications_lazy_tree = LazyTreeview(
+                self.notifications_tree, self._notifications_scrollbar, filtered_notifications,
+                tags=self._notification_tags, format_row=self._format_notification_row,
+                key=attrgetter('id'))
+
+    def _format_notification_row(self, notification: Notification) -> tuple:
+        """Display values of one notification row."""
+        notif_type = notification.type
+        icon = _NOTIFICATION_ICONS.get(notif_type, '📢')
+        
+        # Status with icon
+        status = '✓ Read' if notification.read else '✗ Unread'
+        
+        # Public indicator
+        is_public = 'Yes' if notification.public else 'No'
+        
+        # Truncated message and formatted date are prepared by the model
+        return (f"{icon} {notif_type}", notification.short_message, notification.formatted_date,
+                status, is_public)
+
+    @staticmethod
+    def _notification_tags(notification: Notification) -> tuple:
+        """Color tags of a notification row."""
+        tags = []
+        if notification.public:
+            tags.append('public')
+        tags.append('read' if notification.read else 'unread')
+        return tuple(tags)
+
+    def _update_notification_row(self, notification: Notification) -> None:
+        """Redraw one notification row in place after its read status changed."""
+        tree = self.notifications_tree
+        iid = notification.id
+        if not tree.exists(iid):
+            # Not inserted yet; it will be formatted from the current data when it is
+            self._last_notif_sig = self._notifications_signature()
+            return
+        if self.filter_status_var.get() == "Unread" and notification.read:
+            # The row no longer matches the filter
+            tree.delete(iid)
+        else:
+            tree.item(iid, values=self._format_notification_row(notification),
+                      tags=self._notification_tags(notification))
+        # The list now matches the data again
+        self._last_notif_sig = self._notifications_signature()
 
-            # Load notifications
-            user_notifications = self.data_manager.get_notifications_for_user(self.current_user['username'])
-            
-            # Apply filters
-            filtered_notifications = []
-            filter_type = getattr(self, 'filter_type_var', tk.StringVar(value="All")).get()
-            filter_status = getattr(self, 'filter_status_var', tk.StringVar(value="All")).get()
-            
-            for notification in user_notifications:
-                # Filter by type
-                if filter_type != "All" and notification.get('type') != filter_type:
-                    continue
-                
-                # Filter by status
-                is_read = notification.get('read', False)
-                if filter_status == "Unread" and is_read:
-                    continue
-                if filter_status == "Read" and not is_read:
-                    continue
-                
-                filtered_notifications.append(notification)
-            
-            # Icons for notification types
-            type_icons = {
-                'TASK_COMPLETED': '✅',
-                'BADGE_EARNED': '🏆',
-                'SCHEDULE_UPDATED': '📅',
-                'INFO': 'ℹ️',
-                'REMINDER': '⏰',
-                'ANNOUNCEMENT': '📢'
-            }
-            
-            # Sort by date (most recent first)
-            filtered_notifications.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-            
-            for notification in filtered_notifications[-50:]:  # Limit to last 50
-                notif_type = notification.get('type', 'INFO')
-                icon = type_icons.get(notif_type, '📢')
-                message = notification.get('message', '')
-                
-                # Truncate message if too long
-                if len(message) > 60:
-                    message = message[:57] + '...'
-                
-                # Format date
-                timestamp = notification.get('timestamp', '')
-                if timestamp:
-                    try:
-                        dt = datetime.fromisoformat(timestamp)
-                        formatted_date = dt.strftime('%d/%m %H:%M')
-                    except:
-                        formatted_date = timestamp[:16]
-                else:
-                    formatted_date = 'N/A'
-                
-                # Status with icon
-                status = '✓ Read' if notification.get('read', False) else '✗ Unread'
-                
-                # Public indicator
-                is_public = 'Yes' if notification.get('public', False) else 'No'
-                
-                # Determine tags for colors
-                tags = [notification.get('id', '')]
-                if notification.get('public', False):
-                    tags.append('public')
-                if not notification.get('read', False):
-                    tags.append('unread')
-                else:
-                    tags.append('read')
-                
-                self.notifications_tree.insert('', 'end', values=(
-                    f"{icon} {notif_type}",
-                    message,
-                    formatted_date,
-                    status,
-                    is_public
-                ), tags=tuple(tags))
+    def _schedule_notifications_flush(self) -> None:
+        """Save read/deleted notifications within 500 ms, once for a burst of changes."""
+        if self._notif_flush_after_id is None:
+            self._notif_flush_after_id = self.root.after(500, self._flush_notifications)
+
+    def _flush_notifications(self) -> None:
+        self._notif_flush_after_id = None
+        self.data_manager.flush_notifications()
 
     def delete_selected_notification(self) -> None:
         """Delete selected notification."""
@@ -1675,16 +1985,13 @@ class CleaningManagementApp:
             if not messagebox.askyesno("Confirmation", "Do you really want to delete this notification?"):
                 return
 
-            item = selection[0]
-            notification_id = self.notifications_tree.item(item, 'tags')[0]
+            notification_id = selection[0]
             
-            # Remove the notification from the list
-            self.data_manager.notifications = [
-                n for n in self.data_manager.notifications 
-                if n.get('id') != notification_id
-            ]
-            self.data_manager.save_notifications()
-            self.refresh_notifications()
+            # Remove the notification from the list and drop its row
+            self.data_manager.delete_notification(notification_id)
+            self._schedule_notifications_flush()
+            self.notifications_tree.delete(notification_id)
+            self._last_notif_sig = self._notifications_signature()
             messagebox.showinfo("Success", "Notification deleted.")
         except Exception as e:
             print(f"Error during deletion: {str(e)}\n{traceback.format_exc()}")
@@ -1697,70 +2004,93 @@ class CleaningManagementApp:
             if not selection:
                 return
 
-            item = selection[0]
-            notification_id = self.notifications_tree.item(item, 'tags')[0]
+            notification_id = selection[0]
             
             # Find the notification
-            notification = None
-            for n in self.data_manager.notifications:
-                if n.get('id') == notification_id:
-                    notification = n
-                    break
-
+            notification = self.data_manager.get_notification(notification_id)
             if not notification:
                 return
 
-            # Create a popup window
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Notification Details")
-            dialog.geometry("500x300")
-            dialog.transient(self.root)
-            dialog.grab_set()
-            
-            self._center_window(dialog, 500, 300)
+            if self._notif_details_dialog is None or not self._notif_details_dialog.winfo_exists():
+                self._notif_details_dialog = self._build_notification_details_dialog()
+            dialog = self._notif_details_dialog
+            dialog.notification = notification
 
-            # Popup content
-            ttk.Label(dialog, text="Notification Details", 
-                     style='Title.TLabel').pack(pady=20)
+            dialog.type_label.config(text=f"Type: {notification.type}")
+            dialog.date_label.config(text=f"Date: {notification.timestamp or 'N/A'}")
+            dialog.status_label.config(text=f"Status: {'Read' if notification.read else 'Unread'}")
 
-            details_frame = ttk.Frame(dialog)
-            details_frame.pack(fill='both', expand=True, padx=20, pady=10)
-
-            ttk.Label(details_frame, text=f"Type: {notification.get('type', 'N/A')}", 
-                     style='Heading.TLabel').pack(anchor='w', pady=5)
-            ttk.Label(details_frame, text=f"Date: {notification.get('timestamp', 'N/A')}", 
-                     style='Info.TLabel').pack(anchor='w', pady=5)
-            ttk.Label(details_frame, text=f"Status: {'Read' if notification.get('read', False) else 'Unread'}", 
-                     style='Info.TLabel').pack(anchor='w', pady=5)
-            
-            ttk.Separator(details_frame, orient='horizontal').pack(fill='x', pady=10)
-            
-            ttk.Label(details_frame, text="Message:", style='Heading.TLabel').pack(anchor='w', pady=5)
-            
-            # Text area for the full message
-            message_text = tk.Text(details_frame, height=8, wrap='word', state='normal')
-            message_text.pack(fill='both', expand=True, pady=5)
-            message_text.insert('1.0', notification.get('message', ''))
-            message_text.config(state='disabled')
-
-            # Buttons
-            button_frame = ttk.Frame(dialog)
-            button_frame.pack(pady=20)
+            dialog.message_text.config(state='normal')
+            dialog.message_text.delete('1.0', 'end')
+            dialog.message_text.insert('1.0', notification.message)
+            dialog.message_text.config(state='disabled')
 
-            if not notification.get('read', False):
-                ttk.Button(button_frame, text="Mark as Read", 
-                          style='Success.TButton',
-                          command=lambda: [self.data_manager.mark_notification_read(notification_id), 
-                                          self.refresh_notifications(), dialog.destroy()]).pack(side='left', padx=5)
+            if notification.read:
+                dialog.read_button.pack_forget()
+            else:
+                dialog.read_button.pack(side='left', padx=5, before=dialog.close_button)
 
-            ttk.Button(button_frame, text="Close", 
-                      style='Secondary.TButton',
-                      command=dialog.destroy).pack(side='left', padx=5)
+            self._center_window(dialog, 500, 300)
+            dialog.deiconify()
+            dialog.grab_set()
 
         except Exception as e:
             print(f"Error displaying details: {str(e)}\n{traceback.format_exc()}")
             messagebox.showerror("Error", f"Error displaying details: {str(e)}")
 
+    def _build_notification_details_dialog(self) -> tk.Toplevel:
+        """Build the (hidden) details popup; show_notification_details fills and shows it."""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Notification Details")
+        dialog.transient(self.root)
+
+        def close():
+            dialog.grab_release()
+            dialog.withdraw()
+
+        def mark_read():
+            notification = dialog.notification
+            self.data_manager.mark_notification_read(notification.id)
+            self._update_notification_row(notification)
+            self._schedule_notifications_flush()
+            close()
+
+        dialog.protocol("WM_DELETE_WINDOW", close)
+
+        # Popup content
+        ttk.Label(dialog, text="Notification Details", 
+                 style='Title.TLabel').pack(pady=20)
+
+        details_frame = ttk.Frame(dialog)
+        details_frame.pack(fill='both', expand=True, padx=20, pady=10)
+
+        dialog.type_label = ttk.Label(details_frame, style='Heading.TLabel')
+        dialog.type_label.pack(anchor='w', pady=5)
+        dialog.date_label = ttk.Label(details_frame, style='Info.TLabel')
+        dialog.date_label.pack(anchor='w', pady=5)
+        dialog.status_label = ttk.Label(details_frame, style='Info.TLabel')
+        dialog.status_label.pack(anchor='w', pady=5)
+        
+        ttk.Separator(details_frame, orient='horizontal').pack(fill='x', pady=10)
+        
+        ttk.Label(details_frame, text="Message:", style='Heading.TLabel').pack(anchor='w', pady=5)
+        
+        # Text area for the full message
+        dialog.message_text = tk.Text(details_frame, height=8, wrap='word', state='disabled')
+        dialog.message_text.pack(fill='both', expand=True, pady=5)
+
+        # Buttons; "Mark as Read" is only packed for unread notifications
+        button_frame = ttk.Frame(dialog)
+        button_frame.pack(pady=20)
+
+        dialog.read_button = ttk.Button(button_frame, text="Mark as Read", 
+                                        style='Success.TButton', command=mark_read)
+        dialog.close_button = ttk.Button(button_frame, text="Close", 
+                                         style='Secondary.TButton', command=close)
+        dialog.close_button.pack(side='left', padx=5)
+        return dialog
+
     def show_announcements(self) -> None:
         """Show announcements view."""
         self.clear_content_frame()
@@ -1781,10 +2111,10 @@ class CleaningManagementApp:
         canvas.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
 
-        announcements = [
-            n for n in self.data_manager.notifications
-            if n.get('type') == 'announcement'
-        ]
+        announcements = sorted(
+            (n for n in self.data_manager.notifications if n.type == 'announcement'),
+            key=_NOTIFICATION_TIMESTAMP
+        )
 
         if not announcements:
             ttk.Label(scrollable_frame, text="No announcements available.", 
@@ -1794,11 +2124,11 @@ class CleaningManagementApp:
                 card = ttk.Frame(scrollable_frame, style='Card.TFrame')
                 card.pack(fill='x', padx=20, pady=5)
 
-                ttk.Label(card, text=announcement.get('title', ''), 
+                ttk.Label(card, text=announcement.type, 
                          style='Heading.TLabel').pack(anchor='w', padx=10, pady=5)
-                ttk.Label(card, text=announcement.get('timestamp', '')[:10], 
+                ttk.Label(card, text=announcement.timestamp[:10], 
                          style='Info.TLabel').pack(anchor='w', padx=10)
-                ttk.Label(card, text=announcement.get('message', ''), 
+                ttk.Label(card, text=announcement.message, 
                          style='Info.TLabel', wraplength=600).pack(anchor='w', padx=10, pady=5)
 
     def show_task_quality_dialog(self, task_id: str):
@@ -1835,103 +2165,6 @@ class CleaningManagementApp:
                   style='Primary.TButton',
                   command=save_quality).pack(pady=10)
     
-    def show_performance_metrics(self) -> None:
-        """Show performance metrics interface for chief."""
-        self.clear_content_frame()
-        
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
-        if not building:
-            ttk.Label(self.content_frame, text="No building assigned", 
-                     style='Title.TLabel').pack(pady=50)
-            return
-        
-        ttk.Label(self.content_frame, text=f"🏆 Performance - {building.name}", 
-                 style='Title.TLabel').pack(pady=10)
-        
-        metrics_frame = ttk.LabelFrame(self.content_frame, text="Key Metrics", padding=10)
-        metrics_frame.pack(fill='x', padx=20, pady=10)
-        
-        building_students = [s for s in self.data_manager.students.values() 
-                           if s.building_id == building.id]
-        building_groups = [g for g in self.data_manager.groups.values() 
-                          if g.building_id == building.id and g.active]
-        
-        total_badges = sum(len(s.badges) for s in building_students)
-        active_groups = len(building_groups)
-        
-        metrics = [
-            ("Badges Awarded", total_badges),
-            ("Active Groups", active_groups)
-        ]
-        
-        for i, (label, value) in enumerate(metrics):
-            card = ttk.Frame(metrics_frame, style='Card.TFrame')
-            card.grid(row=0, column=i, padx=5, pady=5, sticky='ew')
-            ttk.Label(card, text=str(value), style='Title.TLabel').pack(pady=5)
-            ttk.Label(card, text=label, style='Info.TLabel').pack(pady=(0, 10))
-            metrics_frame.grid_columnconfigure(i, weight=1)
-        
-        ranking_frame = ttk.LabelFrame(self.content_frame, text="Group Rankings", padding=10)
-        ranking_frame.pack(fill='both', expand=True, padx=20, pady=10)
-        
-        columns = ('Rank', 'Group', 'Members', 'Badges')
-        ranking_tree = ttk.Treeview(ranking_frame, columns=columns, show='headings', height=10)
-        for col in columns:
-            ranking_tree.heading(col, text=col)
-            if col == 'Badges':
-                ranking_tree.column(col, width=300)  # Wider for icons
-            else:
-                ranking_tree.column(col, width=120)
-        
-        scrollbar = ttk.Scrollbar(ranking_frame, orient='vertical', command=ranking_tree.yview)
-        ranking_tree.configure(yscrollcommand=scrollbar.set)
-        ranking_tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
-        
-        # Calculate group scores for the building
-        group_scores = []
-        for group in building_groups:
-            # Count badges by type for the group
-            badge_counts = {badge_type: 0 for badge_type in BADGE_TYPES}
-            member_names = []
-            
-            for member_id in group.members:
-                if member_id in self.data_manager.students:
-                    student = self.data_manager.students[member_id]
-                    member_names.append(student.name)
-                    for badge_key in student.badges:
-                        if badge_key in badge_counts:
-                            badge_counts[badge_key] += 1
-            
-            # Create badge representation with icons
-            badge_icons = []
-            for badge_key, count in badge_counts.items():
-                if count > 0:
-                    badge_info = BADGE_TYPES[badge_key]
-                    badge_icons.append(f"{badge_info['icon']} x{count}")
-            
-            badge_display = " ".join(badge_icons) if badge_icons else "No badges"
-            total_badges = sum(badge_counts.values())
-            
-            # Only rank groups with at least one badge
-            if total_badges > 0:
-                group_scores.append((group, member_names, badge_display, total_badges))
-        
-        # Sort by total badges (descending)
-        group_scores.sort(key=lambda x: x[3], reverse=True)
-        
-        for i, (group, member_names, badge_display, total_badges) in enumerate(group_scores, 1):
-            ranking_tree.insert('', 'end', values=(
-                i,
-                group.name,
-                ", ".join(member_names),
-                badge_display
-            ))
-        
-        if not group_scores:
-            ttk.Label(ranking_frame, text="No group has earned badges yet.", 
-                     style='Info.TLabel').pack(pady=20)
-    
     def show_export_options(self) -> None:
         """Show export options for chief."""
         self.clear_content_frame()
@@ -1942,12 +2175,10 @@ class CleaningManagementApp:
         export_frame = ttk.LabelFrame(self.content_frame, text="Export Data", padding=20)
         export_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if building:
-            building_students = [s for s in self.data_manager.students.values() 
-                               if s.building_id == building.id]
-            building_groups = [g for g in self.data_manager.groups.values() 
-                             if g.building_id == building.id]
+            building_students = self.data_manager.get_students_by_building(building.id)
+            building_groups = self.data_manager.get_groups_by_building(building.id)
             
             export_options = [
                 ("📊 Export Student List", lambda: self.export_building_students(building_students)),
@@ -1986,69 +2217,65 @@ class CleaningManagementApp:
             ttk.Label(history_frame, text="No exports found", 
                      style='Info.TLabel').pack(pady=20)
     
-    def export_building_students(self, students: list) -> None:
-        """Export building students to CSV."""
+    def _export_in_background(self, export: Callable, args: tuple, success: str, failure: str) -> None:
+        """Run export(*args) on a worker thread, then report the file(s) it wrote.
+
+        args are deep-copied here on the Tk thread, which keeps changing the live data,
+        so the worker only ever reads its own copy.
+        """
+        args = copy.deepcopy(args)
+        self._run_in_background(lambda: export(*args),
+                                lambda future: self._on_export_done(future, success, failure))
+
+    def _on_export_done(self, future: Future, success: str, failure: str) -> None:
+        """Report the outcome of a background export (one path or a list of paths)."""
         try:
-            students_dict = {s.id: s for s in students}
-            filepath = self.exporter.export_students_to_csv(students_dict, self.data_manager.buildings)
-            if filepath:
-                messagebox.showinfo("Success", f"Student list exported to:\n{filepath}")
+            result = future.result()
+            if result:
+                files = result if isinstance(result, str) else '\n'.join(result)
+                messagebox.showinfo("Success", f"{success}\n{files}")
             else:
-                messagebox.showerror("Error", "Error during export.")
+                messagebox.showerror("Error", failure)
         except Exception as e:
-            print(f"Error during export: {str(e)}\n{traceback.format_exc()}")
+            logger.exception("Error during export")
             messagebox.showerror("Error", f"Error during export: {str(e)}")
+
+    def export_building_students(self, students: list) -> None:
+        """Export building students to CSV."""
+        students_dict = {s.id: s for s in students}
+        self._export_in_background(
+            self.exporter.export_students_to_csv, (students_dict, self.data_manager.buildings),
+            "Student list exported to:", "Error during export.")
     
     def export_building_performance(self, building: Building) -> None:
         """Export building performance to CSV."""
-        try:
-            buildings_dict = {building.id: building}
-            filepath = self.exporter.export_building_performance_to_csv(buildings_dict, self.data_manager.students)
-            if filepath:
-                messagebox.showinfo("Success", f"Performance exported to:\n{filepath}")
-            else:
-                messagebox.showerror("Error", "Error during export.")
-        except Exception as e:
-            print(f"Error during export: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error during export: {str(e)}")
+        buildings_dict = {building.id: building}
+        self._export_in_background(
+            self.exporter.export_building_performance_to_csv, (buildings_dict, self.data_manager.students),
+            "Performance exported to:", "Error during export.")
     
     def export_building_badges(self, students: list) -> None:
         """Export building badges to CSV."""
-        try:
-            students_dict = {s.id: s for s in students}
-            filepath = self.exporter.export_badge_summary_to_csv(students_dict, self.data_manager.badges)
-            if filepath:
-                messagebox.showinfo("Success", f"Badges exported to:\n{filepath}")
-            else:
-                messagebox.showerror("Error", "Error during export.")
-        except Exception as e:
-            print(f"Error during export: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error during export: {str(e)}")
+        students_dict = {s.id: s for s in students}
+        self._export_in_background(
+            self.exporter.export_badge_summary_to_csv, (students_dict, self.data_manager.badges),
+            "Badges exported to:", "Error during export.")
     
     def export_complete_building_report(self, building: Building) -> None:
         """Export complete building report."""
-        try:
-            building_students = {s.id: s for s in self.data_manager.students.values() 
-                               if s.building_id == building.id}
-            building_groups = {g.id: g for g in self.data_manager.groups.values() 
-                             if g.building_id == building.id}
-            
-            exported_files = self.exporter.export_complete_report(
+        building_students = self.data_manager.students_by_building.get(building.id, {})
+        building_groups = self.data_manager.groups_by_building.get(building.id, {})
+        
+        self._export_in_background(
+            self.exporter.export_complete_report,
+            (
                 building_students,
                 {building.id: building},
                 building_groups,
                 self.data_manager.badges,
                 self.data_manager.notifications
-            )
-            
-            if exported_files:
-                files_list = '\n'.join(exported_files)
-                messagebox.showinfo("Success", f"Complete report exported:\n{files_list}")
-            else:
-                messagebox.showerror("Error", "Error exporting the report.")
-        except Exception as e:
-            print(f"Error during export: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error during export: {str(e)}")
+            ),
+            "Complete report exported:", "Error exporting the report.")
     
     def show_student_interface(self) -> None:
         """Show student/guest interface."""
@@ -2238,7 +2465,7 @@ class CleaningManagementApp:
         self.create_stat_card(stats_row, "🏢", "Buildings", str(total_buildings), "Total")
         self.create_stat_card(stats_row, "👥", "Students", str(total_students), "Active")
         self.create_stat_card(stats_row, "👑", "Chiefs", str(buildings_with_chief), "Assigned")
-        self.create_stat_card(stats_row, "📊", "Occupancy", f"{(total_students/(total_buildings*16))*100:.0f}%", "Average")
+        self.create_stat_card(stats_row, "📊", "Occupancy", f"{(total_students/(total_buildings*TOTAL_PEOPLE_PER_BUILDING))*100:.0f}%", "Average")
         
         grid_frame = ttk.LabelFrame(self.content_frame, text="Details by Building", padding=10)
         grid_frame.pack(fill='both', expand=True, padx=20, pady=10)
@@ -2290,7 +2517,7 @@ class CleaningManagementApp:
         ttk.Label(card, text=status_text, foreground=status_color,
                  font=('Segoe UI', 8, 'bold')).pack(anchor='w')
         
-        ttk.Label(card, text=f"👥 {len(building.students)}/16 students", 
+        ttk.Label(card, text=f"👥 {len(building.students)}/{TOTAL_PEOPLE_PER_BUILDING} students", 
                  style='Info.TLabel').pack(anchor='w')
         
         if building.chief_id:
@@ -2365,38 +2592,9 @@ class CleaningManagementApp:
         rankings_tree.pack(side='left', fill='both', expand=True)
         scrollbar.pack(side='right', fill='y')
         
-        # Calculate group scores
-        group_scores = []
-        for group in self.data_manager.groups.values():
-            if group.active:  # Only active groups
-                # Count badges by type for the group
-                badge_counts = {badge_type: 0 for badge_type in BADGE_TYPES}
-                member_names = []
-                
-                for member_id in group.members:
-                    if member_id in self.data_manager.students:
-                        student = self.data_manager.students[member_id]
-                        member_names.append(student.name)
-                        for badge_key in student.badges:
-                            if badge_key in badge_counts:
-                                badge_counts[badge_key] += 1
-                
-                # Create badge representation with icons
-                badge_icons = []
-                for badge_key, count in badge_counts.items():
-                    if count > 0:
-                        badge_info = BADGE_TYPES[badge_key]
-                        badge_icons.append(f"{badge_info['icon']} x{count}")
-                
-                badge_display = " ".join(badge_icons) if badge_icons else "No badges"
-                total_badges = sum(badge_counts.values())
-                
-                # Only rank groups with at least one badge
-                if total_badges > 0:
-                    group_scores.append((group, member_names, badge_display, total_badges))
-        
-        # Sort by total badges (descending)
-        group_scores.sort(key=lambda x: x[3], reverse=True)
+        # Calculate group scores (active groups only)
+        group_scores = self._rank_groups_by_badges(
+            g for g in self.data_manager.groups.values() if g.active)
         
         for i, (group, member_names, badge_display, total_badges) in enumerate(group_scores, 1):
             rankings_tree.insert('', 'end', values=(
@@ -2426,14 +2624,13 @@ class CleaningManagementApp:
         badges_grid = ttk.Frame(types_frame)
         badges_grid.pack(fill='x')
         
-        badge_items = list(BADGE_TYPES.items())
-        for i in range(0, len(badge_items), 2):
+        badge_count = len(BADGE_KEYS)
+        for i in range(0, badge_count, 2):
             row_frame = ttk.Frame(badges_grid)
             row_frame.pack(fill='x', pady=5)
             for j in range(2):
-                if i + j < len(badge_items):
-                    badge_type, badge_info = badge_items[i + j]
-                    self.create_badge_display_card(row_frame, badge_info)
+                if i + j < badge_count:
+                    self.create_badge_display_card(row_frame, i + j)
         
         # Find the best group (the one with the most badges)
         all_groups = list(self.data_manager.groups.values())
@@ -2451,29 +2648,23 @@ class CleaningManagementApp:
             ttk.Label(best_group_frame, text="Members: " + ", ".join(member_names), style='Heading.TLabel').pack(anchor='w', pady=5)
             
             # Count badges by type for the group
-            badge_counts = {k: 0 for k in BADGE_TYPES}
-            for m_id in best_group.members:
-                if m_id in self.data_manager.students:
-                    for badge_key in self.data_manager.students[m_id].badges:
-                        if badge_key in badge_counts:
-                            badge_counts[badge_key] += 1
+            badge_counts = count_group_badges(best_group.members, self.data_manager.students)
             badges_line = ttk.Frame(best_group_frame)
             badges_line.pack(anchor='w', pady=5)
-            for badge_key, count in badge_counts.items():
-                if count > 0:
-                    badge_info = BADGE_TYPES[badge_key]
-                    ttk.Label(badges_line, text=f"{badge_info['icon']} x{count}", font=('Segoe UI', 14)).pack(side='left', padx=8)
+            for label in badge_count_labels(badge_counts):
+                ttk.Label(badges_line, text=label, font=('Segoe UI', 14)).pack(side='left', padx=8)
         else:
             ttk.Label(self.content_frame, text="No group has earned badges yet.", style='Info.TLabel').pack(pady=10)
     
-    def create_badge_display_card(self, parent: ttk.Frame, badge_info: dict) -> None:
+    def create_badge_display_card(self, parent: ttk.Frame, badge_index: int) -> None:
         """Create a card to display badge information."""
+        name, description, _, icon = badge(badge_index)
         card = ttk.Frame(parent, style='Card.TFrame')
         card.pack(side='left', fill='both', expand=True, padx=5, pady=5)
         
-        ttk.Label(card, text=badge_info['icon'], font=('Segoe UI', 20)).pack(pady=5)
-        ttk.Label(card, text=badge_info['name'], style='Heading.TLabel').pack()
-        ttk.Label(card, text=badge_info['description'], style='Info.TLabel', 
+        ttk.Label(card, text=icon, font=('Segoe UI', 20)).pack(pady=5)
+        ttk.Label(card, text=name, style='Heading.TLabel').pack()
+        ttk.Label(card, text=description, style='Info.TLabel', 
                  wraplength=150).pack(pady=(0, 5))
     
     def show_public_notifications(self) -> None:
@@ -2510,16 +2701,6 @@ class CleaningManagementApp:
                      style='Info.TLabel').pack(pady=50)
             return
         
-        # Icons for notification types
-        type_icons = {
-            'TASK_COMPLETED': '✅',
-            'BADGE_EARNED': '🏆',
-            'SCHEDULE_UPDATED': '📅',
-            'INFO': 'ℹ️',
-            'REMINDER': '⏰',
-            'ANNOUNCEMENT': '📢'
-        }
-        
         columns = ('Type', 'Message', 'Date')
         notif_tree = ttk.Treeview(notif_frame, columns=columns, show='headings', height=15)
         
@@ -2543,19 +2724,19 @@ class CleaningManagementApp:
         scrollbar.pack(side='right', fill='y')
         
         # Sort by date (most recent first)
-        public_notifications.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+        public_notifications.sort(key=_NOTIFICATION_TIMESTAMP, reverse=True)
         
         for notification in public_notifications[-20:]:  # Limit to last 20
-            notif_type = notification.get('type', 'INFO')
-            icon = type_icons.get(notif_type, '📢')
-            message = notification.get('message', '')
+            notif_type = notification.type
+            icon = _NOTIFICATION_ICONS.get(notif_type, '📢')
+            message = notification.message
             
             # Truncate message if too long
             if len(message) > 80:
                 message = message[:77] + '...'
             
             # Format date
-            timestamp = notification.get('timestamp', '')
+            timestamp = notification.timestamp
             if timestamp:
                 try:
                     dt = datetime.fromisoformat(timestamp)
@@ -2683,67 +2864,37 @@ class CleaningManagementApp:
 
     def generate_global_performance_report(self) -> None:
         """Generate global performance report."""
-        try:
-            filepaths = self.exporter.export_complete_report(
+        self._export_in_background(
+            self.exporter.export_complete_report,
+            (
                 self.data_manager.students,
                 self.data_manager.buildings,
                 self.data_manager.groups,
                 self.data_manager.badges,
                 self.data_manager.notifications
-            )
-            if filepaths:
-                msg = "Reports exported:\n" + "\n".join(filepaths)
-                messagebox.showinfo("Success", msg)
-            else:
-                messagebox.showerror("Error", "Error generating the report.")
-        except Exception as e:
-            print(f"Error: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error: {str(e)}")
+            ),
+            "Reports exported:", "Error generating the report.")
 
     def generate_building_report(self) -> None:
         """Generate building-specific report."""
-        try:
-            filepath = self.exporter.export_building_performance_to_csv(
-                self.data_manager.buildings,
-                self.data_manager.students
-            )
-            if filepath:
-                messagebox.showinfo("Success", f"Report exported to:\n{filepath}")
-            else:
-                messagebox.showerror("Error", "Error generating the report.")
-        except Exception as e:
-            print(f"Error: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error: {str(e)}")
+        self._export_in_background(
+            self.exporter.export_building_performance_to_csv,
+            (self.data_manager.buildings, self.data_manager.students),
+            "Report exported to:", "Error generating the report.")
 
     def generate_students_report(self) -> None:
         """Generate students report."""
-        try:
-            filepath = self.exporter.export_students_to_csv(
-                self.data_manager.students,
-                self.data_manager.buildings
-            )
-            if filepath:
-                messagebox.showinfo("Success", f"Report exported to:\n{filepath}")
-            else:
-                messagebox.showerror("Error", "Error generating the report.")
-        except Exception as e:
-            print(f"Error: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error: {str(e)}")
+        self._export_in_background(
+            self.exporter.export_students_to_csv,
+            (self.data_manager.students, self.data_manager.buildings),
+            "Report exported to:", "Error generating the report.")
 
     def generate_badges_report(self) -> None:
         """Generate badges report."""
-        try:
-            filepath = self.exporter.export_badge_summary_to_csv(
-                self.data_manager.students,
-                self.data_manager.badges
-            )
-            if filepath:
-                messagebox.showinfo("Success", f"Report exported to:\n{filepath}")
-            else:
-                messagebox.showerror("Error", "Error generating the report.")
-        except Exception as e:
-            print(f"Error: {str(e)}\n{traceback.format_exc()}")
-            messagebox.showerror("Error", f"Error: {str(e)}")
+        self._export_in_background(
+            self.exporter.export_badge_summary_to_csv,
+            (self.data_manager.students, self.data_manager.badges),
+            "Report exported to:", "Error generating the report.")
 
     def show_backup_options(self) -> None:
         """Show backup options for admin."""
@@ -2902,6 +3053,7 @@ class CleaningManagementApp:
             building.name = name
             building.blocks = blocks
             building.rooms_per_block = rooms_per_block
+            building.invalidate_occupancy()
 
             if self.data_manager.update_building(building):
                 messagebox.showinfo("Success", "Building updated successfully!")
@@ -2943,16 +3095,26 @@ class CleaningManagementApp:
 
     def logout(self) -> None:
         """Log out the current user."""
+        self._cancel_pending_refreshes()
         self.current_user = None
         self.current_role = None
-        self._clear_frame(self.main_frame)
         self.show_login_screen()
 
+    def _cancel_pending_refreshes(self) -> None:
+        """Drop debounced screen refreshes, so they never redraw over the next screen."""
+        self._refresh_groups_debounced.cancel()
+        self._refresh_notifications_debounced.cancel()
+
     def clear_content_frame(self) -> None:
         """Clear the content frame."""
+        self._cancel_pending_refreshes()
         if self.content_frame:
             self._clear_frame(self.content_frame)
 
+    def _current_building(self) -> Optional[Building]:
+        """Return the building managed by the logged-in chief, if any."""
+        return self.data_manager.get_building_by_chief(self.current_user['username'])
+
     def show_admin_dashboard(self) -> None:
         """Show admin dashboard with enhanced statistics and controls."""
         self.clear_content_frame()
@@ -3035,7 +3197,6 @@ class CleaningManagementApp:
                 allowed_types = filter_mapping.get(filter_value, None)
                 
                 # Calculate the cutoff date based on the period
-                from datetime import datetime, timedelta
                 today = datetime.now()
                 
                 if period_value == "Today":
@@ -3048,6 +3209,7 @@ class CleaningManagementApp:
                 else:
                     start_date = None  # All periods
                 
+                rows = []
                 for activity in activities:
                     activity_type = activity.get('type', '')
                     
@@ -3103,13 +3265,14 @@ class CleaningManagementApp:
                         'SYSTEM_LOGIN': 'System Login'
                     }.get(activity_type, activity_type)
                     
-                    activity_tree.insert('', 'end', values=(
+                    rows.append((
                         formatted_time,
                         f"{icon} {type_display}",
                         activity.get('description', '')
                     ))
-            except Exception as e:
-                print(f"Error retrieving recent activities: {e}")
+                insert_tree_rows(activity_tree, rows)
+            except Exception:
+                logger.exception("Error retrieving recent activities")
                 messagebox.showerror("Error", "Unable to display recent activities.")
 
         ttk.Button(activity_toolbar, text="🔄 Refresh", style='Secondary.TButton',
@@ -3140,11 +3303,29 @@ class CleaningManagementApp:
         activity_filter_combo.bind('<<ComboboxSelected>>', lambda e: refresh_activities())
         period_filter_combo.bind('<<ComboboxSelected>>', lambda e: refresh_activities())
 
+    def _rank_groups_by_badges(self, groups) -> list:
+        """(group, member names, badge display, total badges) for groups with badges, most first."""
+        students = self.data_manager.students
+        group_scores = []
+        for group in groups:
+            badge_counts = count_group_badges(group.members, students)
+            badge_icons = badge_count_labels(badge_counts)
+            total_badges = sum(badge_counts[key] for key in BADGE_KEYS)
+            
+            # Only rank groups with at least one badge
+            if total_badges > 0:
+                member_names = [students[m_id].name for m_id in group.members if m_id in students]
+                group_scores.append((group, member_names, " ".join(badge_icons), total_badges))
+        
+        # Sort by total badges (descending)
+        group_scores.sort(key=lambda x: x[3], reverse=True)
+        return group_scores
+
     def show_performance_metrics(self) -> None:
         """Show performance metrics interface for chief."""
         self.clear_content_frame()
         
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned", 
                      style='Title.TLabel').pack(pady=50)
@@ -3156,12 +3337,9 @@ class CleaningManagementApp:
         metrics_frame = ttk.LabelFrame(self.content_frame, text="Key Metrics", padding=10)
         metrics_frame.pack(fill='x', padx=20, pady=10)
         
-        building_students = [s for s in self.data_manager.students.values() 
-                           if s.building_id == building.id]
-        building_groups = [g for g in self.data_manager.groups.values() 
-                          if g.building_id == building.id and g.active]
+        building_groups = [g for g in self.data_manager.get_groups_by_building(building.id) if g.active]
         
-        total_badges = sum(len(s.badges) for s in building_students)
+        total_badges = self.data_manager.badges_by_building[building.id]
         active_groups = len(building_groups)
         
         metrics = [
@@ -3194,36 +3372,7 @@ class CleaningManagementApp:
         scrollbar.pack(side='right', fill='y')
         
         # Calculate group scores for the building
-        group_scores = []
-        for group in building_groups:
-            # Count badges by type for the group
-            badge_counts = {badge_type: 0 for badge_type in BADGE_TYPES}
-            member_names = []
-            
-            for member_id in group.members:
-                if member_id in self.data_manager.students:
-                    student = self.data_manager.students[member_id]
-                    member_names.append(student.name)
-                    for badge_key in student.badges:
-                        if badge_key in badge_counts:
-                            badge_counts[badge_key] += 1
-            
-            # Create badge representation with icons
-            badge_icons = []
-            for badge_key, count in badge_counts.items():
-                if count > 0:
-                    badge_info = BADGE_TYPES[badge_key]
-                    badge_icons.append(f"{badge_info['icon']} x{count}")
-            
-            badge_display = " ".join(badge_icons) if badge_icons else "No badges"
-            total_badges = sum(badge_counts.values())
-            
-            # Only rank groups with at least one badge
-            if total_badges > 0:
-                group_scores.append((group, member_names, badge_display, total_badges))
-        
-        # Sort by total badges (descending)
-        group_scores.sort(key=lambda x: x[3], reverse=True)
+        group_scores = self._rank_groups_by_badges(building_groups)
         
         for i, (group, member_names, badge_display, total_badges) in enumerate(group_scores, 1):
             ranking_tree.insert('', 'end', values=(
@@ -3241,7 +3390,7 @@ class CleaningManagementApp:
         """Show tasks overview for chief with filtering options."""
         self.clear_content_frame()
 
-        building = self.data_manager.get_building_by_chief(self.current_user['username'])
+        building = self._current_building()
         if not building:
             ttk.Label(self.content_frame, text="No building assigned", 
                      style='Title.TLabel').pack(pady=50)
@@ -2,6 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+import logging
 import traceback
 
 # Add the project root to the Python path
@@ -9,12 +10,14 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from interface.gui import CleaningManagementApp
 from services.data_manager import DataManager
+from constants import MIN_WIDTH, MIN_HEIGHT
 
 def main():
     """Main function to start the application"""
+    logging.basicConfig(level=logging.WARNING)
     try:
-        # Initialize data manager
-        data_manager = DataManager()
+        # Initialize data manager (data is loaded by the app in the background)
+        data_manager = DataManager(load=False)
         
         # Create root window
         root = tk.Tk()
@@ -22,7 +25,7 @@ def main():
         # Configure root window
         root.title("Cleaning Management System - University Residence")
         root.geometry("1000x650")
-        root.minsize(1000, 600)
+        root.minsize(MIN_WIDTH, MIN_HEIGHT)
     
         # Set application icon (if available)
         icon_path = os.path.join(os.path.dirname(__file__), 'data', 'icon.ico')
@@ -47,11 +50,13 @@ def main():
         def on_closing():
             if messagebox.askokcancel("Quit", "Do you really want to quit the application?"):
                 try:
-                    # Save data via the data_manager
-                    data_manager.save_buildings()
-                    data_manager.save_students()
-                    data_manager.save_groups()
-                    data_manager.save_notifications()
+                    # Save data via the data_manager, unless it never finished loading
+                    if data_manager.loaded:
+                        data_manager.save_buildings()
+                        data_manager.save_students()
+                        data_manager.save_groups()
+                        data_manager.save_notifications()
+                        data_manager.flush_writes()
                 except Exception as e:
                     print("[Error during save]", traceback.format_exc())
                     messagebox.showerror("Error", f"Error during save: {str(e)}")
@@ -33,6 +33,9 @@ class Building:
     overall_completion_rate: float = 0.0
     last_schedule_update: Optional[str] = None
 
+    # Cached occupancy rate; cleared whenever students or the room layout change
+    _occupancy_rate_cache: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self):
         if not self.custom_cleaning_areas:
             self.custom_cleaning_areas = ['Rooms', 'Showers', 'Kitchen', 'Living Room', 'Terrace']
@@ -51,9 +54,14 @@ class Building:
         return len(self.blocks) * self.rooms_per_block * self.people_per_room
 
     def get_occupancy_rate(self) -> float:
-        if self.get_total_capacity() == 0:
-            return 0.0
-        return len(self.students) / self.get_total_capacity()
+        if self._occupancy_rate_cache is None:
+            capacity = self.get_total_capacity()
+            self._occupancy_rate_cache = len(self.students) / capacity if capacity else 0.0
+        return self._occupancy_rate_cache
+
+    def invalidate_occupancy(self):
+        """Drop the cached occupancy rate after students or capacity change"""
+        self._occupancy_rate_cache = None
 
     def add_student(self, student_id: str) -> bool:
         """Add student to the first available room (max 2 per room)"""
@@ -69,6 +77,7 @@ class Building:
                     assigned_students.append(student_id)
                     self.room_assignments[room_key] = assigned_students
                     self.students.append(student_id)
+                    self.invalidate_occupancy()
                     return True
         return False  # No room with space
 
@@ -78,6 +87,7 @@ class Building:
             return False
 
         self.students.remove(student_id)
+        self.invalidate_occupancy()
 
         # Remove from room assignments
         for room_key, student_list in list(self.room_assignments.items()):
@@ -35,17 +35,37 @@ class CleaningGroup:
     created_date: str = field(default_factory=lambda: datetime.now().isoformat())
     last_rotation: str = field(default_factory=lambda: datetime.now().isoformat())
     
+    # Running sum of completed-task quality scores, kept in step with completed_tasks
+    _quality_sum: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Cached ", "-joined member names; cleared when members (or their students) change
+    _member_names: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._quality_sum = sum(task.get('quality_score', 0) for task in self.completed_tasks)
+    
     def add_member(self, student_id: str) -> bool:
         """Add a member to the cleaning group"""
         if student_id not in self.members:
             self.members.append(student_id)
+            self._member_names = None
             return True
         return False
     
+    def get_member_names(self, students: Dict) -> str:
+        """Comma-separated names of the members found in students (cached)"""
+        if self._member_names is None:
+            self._member_names = ", ".join(students[m_id].name for m_id in self.members if m_id in students)
+        return self._member_names
+    
+    def invalidate_member_names(self):
+        """Drop the cached member names, e.g. after a member's student record changed"""
+        self._member_names = None
+    
     def remove_member(self, student_id: str) -> bool:
         """Remove a member from the cleaning group"""
         if student_id in self.members:
             self.members.remove(student_id)
+            self._member_names = None
             return True
         return False
     
@@ -119,6 +139,7 @@ class CleaningGroup:
         }
         
         self.completed_tasks.append(task)
+        self._quality_sum += quality_score
         
         # Update schedule status
         if date in self.rotation_schedule:
@@ -126,6 +147,16 @@ class CleaningGroup:
         
         self._update_performance_score()
     
+    def update_task_quality(self, date: str, area: str, quality_score: int) -> bool:
+        """Change the score of an already completed task; False if it was never completed"""
+        for task in self.completed_tasks:
+            if task['date'] == date and task['area'] == area:
+                self._quality_sum += quality_score - task.get('quality_score', 0)
+                task['quality_score'] = quality_score
+                self._update_performance_score()
+                return True
+        return False
+    
     def mark_task_missed(self, date: str, area: str, assigned_members: List[str], 
                         reason: str = ""):
         """Mark a cleaning task as missed"""
@@ -155,8 +186,7 @@ class CleaningGroup:
             
             # Calculate quality average
             if self.completed_tasks:
-                quality_sum = sum(task.get('quality_score', 0) for task in self.completed_tasks)
-                quality_average = quality_sum / len(self.completed_tasks)
+                quality_average = self._quality_sum / len(self.completed_tasks)
             else:
                 quality_average = 0
             
@@ -206,6 +236,7 @@ class CleaningGroup:
         if len(self.members) > 1:
             # Rotate the member list
             self.members = self.members[1:] + [self.members[0]]
+            self._member_names = None
             self.last_rotation = datetime.now().isoformat()
     
     def to_dict(self) -> Dict:
@@ -237,7 +268,8 @@ class CleaningGroup:
             members=data.get('members', []),
             assigned_areas=data.get('assigned_areas', []),
             block_restriction=data.get('block_restriction'),
-            rotation_schedule=data.get('rotation_schedule', {}),
+            # Keep dates in chronological (ISO string) order so readers need not sort
+            rotation_schedule=dict(sorted(data.get('rotation_schedule', {}).items())),
             current_week_tasks=data.get('current_week_tasks', []),
             completed_tasks=data.get('completed_tasks', []),
             missed_tasks=data.get('missed_tasks', []),
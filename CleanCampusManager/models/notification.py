@@ -0,0 +1,65 @@
+"""
+Notification model for the Cleaning Management System
+Represents messages shown in the notification center
+"""
+
+import sys
+from typing import Dict
+from datetime import datetime
+
+
+class Notification:
+    """Notification with its list-view display fields prepared up front"""
+
+    # Fixed attribute layout: no per-instance __dict__ (dataclass(slots=True) needs Python 3.10)
+    __slots__ = ('id', 'message', 'type', 'target_user', 'timestamp', 'read', 'public',
+                 'formatted_date', 'short_message')
+
+    def __init__(self, id: str, message: str = '', type: str = 'INFO', target_user: str = '',
+                 timestamp: str = '', read: bool = False, public: bool = False):
+        self.id = id
+        self.message = message
+        # Types and targets repeat across notifications and are used as filters
+        self.type = sys.intern(type)
+        self.target_user = sys.intern(target_user)
+        self.timestamp = timestamp
+        self.read = read
+        self.public = public
+
+        # Display fields for the notification list (not saved)
+        if timestamp:
+            try:
+                self.formatted_date = datetime.fromisoformat(timestamp).strftime('%d/%m %H:%M')
+            except ValueError:
+                self.formatted_date = timestamp[:16]
+        else:
+            self.formatted_date = 'N/A'
+        self.short_message = message[:57] + '...' if len(message) > 60 else message
+
+    def __repr__(self) -> str:
+        return f"Notification(id={self.id!r}, type={self.type!r}, target_user={self.target_user!r})"
+
+    def to_dict(self) -> Dict:
+        """Convert notification object to dictionary for JSON serialization"""
+        return {
+            'id': self.id,
+            'message': self.message,
+            'type': self.type,
+            'target_user': self.target_user,
+            'timestamp': self.timestamp,
+            'read': self.read,
+            'public': self.public
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Notification':
+        """Create notification object from dictionary"""
+        return cls(
+            id=data.get('id', ''),
+            message=data.get('message', ''),
+            type=data.get('type') or 'INFO',
+            target_user=data.get('target_user') or '',
+            timestamp=data.get('timestamp', ''),
+            read=data.get('read', False),
+            public=data.get('public', False)
+        )
@@ -3,9 +3,28 @@ Student model for the Cleaning Management System
 Represents individual students with their information and cleaning assignments
 """
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
-from datetime import datetime
+from typing import Deque, List, Dict, Optional
+from datetime import datetime, timedelta
+
+
+@dataclass
+class TaskStats:
+    """Completion times of a student's saved tasks, updated one task at a time"""
+
+    recent: Deque[datetime] = field(default_factory=deque)
+
+    def record(self, when: datetime):
+        """Add one completed task (completion times arrive in order)"""
+        self.recent.append(when)
+
+    def recent_count(self, now: datetime, days: int = 30) -> int:
+        """Number of recorded tasks completed within the last `days` days"""
+        cutoff = now - timedelta(days=days + 1)
+        while self.recent and self.recent[0] <= cutoff:
+            self.recent.popleft()
+        return len(self.recent)
 
 @dataclass
 class Student:
@@ -23,6 +42,7 @@ class Student:
     assigned_groups: List[str] = field(default_factory=list)
     badges: List[str] = field(default_factory=list)
     last_activity: Optional[str] = None
+    _task_stats: Optional[TaskStats] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.last_activity is None:
@@ -64,6 +84,31 @@ class Student:
             last_activity=data.get('last_activity')
         )
 
+    def get_task_stats(self, groups: Dict[str, 'CleaningGroup']) -> TaskStats:
+        """Running task stats, seeded from the groups' completed tasks on first use"""
+        if self._task_stats is None:
+            history = []
+            for group in groups.values():
+                if self.id in group.members:
+                    for task in group.completed_tasks:
+                        if self.id not in task.get('completed_by', []):
+                            continue
+                        try:
+                            completion_time = datetime.fromisoformat(task.get('completion_time', ''))
+                        except Exception:
+                            continue
+                        history.append(completion_time)
+            history.sort()
+            stats = TaskStats()
+            for completion_time in history:
+                stats.record(completion_time)
+            self._task_stats = stats
+        return self._task_stats
+
+    def reset_task_stats(self):
+        """Forget the running task stats; the next get_task_stats rebuilds them"""
+        self._task_stats = None
+
     def get_tasks_in_last_30_days(self, groups: Dict[str, 'CleaningGroup']) -> int:
         """Returns the number of tasks completed by the student in the last 30 days."""
         count = 0
@@ -0,0 +1,57 @@
+"""
+Background writer for the Cleaning Management System
+Runs data file writes on a worker thread so callers (the Tk event loop) do not wait on disk
+"""
+
+import threading
+import traceback
+from typing import Callable, Dict, Optional
+
+
+class AsyncWriter:
+    """Single worker thread running queued writes, newest data per file wins"""
+
+    def __init__(self, write: Callable[[str, object], None]):
+        self._write = write
+        self._pending: Dict[str, object] = {}
+        # File being written by the worker right now
+        self._writing: Optional[str] = None
+        self._cond = threading.Condition()
+        self._thread = None
+
+    def submit(self, filename: str, data) -> None:
+        """Queue data to be written to filename; replaces a not-yet-written submission"""
+        with self._cond:
+            self._pending[filename] = data
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='AsyncWriter', daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        """Block until every submitted write has been written"""
+        with self._cond:
+            while self._pending or self._writing is not None:
+                self._cond.wait()
+
+    def is_pending(self, filename: str) -> bool:
+        """True while a submitted write of filename has not reached the disk"""
+        with self._cond:
+            return filename in self._pending or self._writing == filename
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                filename = next(iter(self._pending))
+                data = self._pending.pop(filename)
+                self._writing = filename
+            try:
+                self._write(filename, data)
+            except Exception as e:
+                print(f"Error writing {filename}: {e}\n{traceback.format_exc()}")
+            finally:
+                with self._cond:
+                    self._writing = None
+                    self._cond.notify_all()
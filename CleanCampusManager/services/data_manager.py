@@ -1,19 +1,32 @@
 import json
 import os
 import shutil
+import sys
 from datetime import datetime
 from typing import Dict, List, Optional
 import traceback
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from operator import attrgetter, itemgetter
 
 from models.student import Student
 from models.building import Building
 from models.group import CleaningGroup
+from models.notification import Notification
+from services.async_writer import AsyncWriter
 from constants import DATA_PATHS, DEFAULT_BUILDINGS, USER_ROLES, BADGE_TYPES
 
+# _mtimes value for a data file that has not been loaded yet
+_NOT_LOADED = object()
+
 class DataManager:
     """Service for managing application data persistence"""
 
-    def __init__(self):
+    # Data files, in the order they are loaded
+    DATA_FILES = ('users.json', 'buildings.json', 'students.json',
+                  'groups.json', 'badges.json', 'notifications.json')
+
+    def __init__(self, load: bool = True):
         # Get the directory of the main script (main.py)
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         self.data_dir = os.path.join(script_dir, "data")
@@ -24,9 +37,42 @@ class DataManager:
         self.buildings: Dict[int, Building] = {}
         self.groups: Dict[str, CleaningGroup] = {}
         self.badges: Dict[str, List] = {}
-        self.notifications: List[Dict] = []
-
-        self.load_all_data()
+        self.notifications: List[Notification] = []
+        # Per-building indexes, kept in sync by the load/add/remove methods below
+        # (building id -> {item id: item}, so removals are O(1))
+        self.students_by_building: Dict[int, Dict[str, Student]] = defaultdict(dict)
+        self.groups_by_building: Dict[int, Dict[str, CleaningGroup]] = defaultdict(dict)
+        # building id -> number of badges held by its students
+        self.badges_by_building: Counter = Counter()
+        # Highest student id sequence number used per building (the trailing _N of the id)
+        self._student_seq: Dict[int, int] = {}
+        # Highest notif_N number in use, so new ids never reuse a deleted one
+        self._notif_seq = 0
+        # notification id -> index in self.notifications, kept in step with the list
+        self._notif_pos: Dict[str, int] = {}
+        # Bumped on every notification change; query_notifications results are cached per version
+        self._notif_version = 0
+        self._notif_query_cache: Dict[tuple, List[Notification]] = {}
+        self._notif_query_version = -1
+        # Bumped whenever buildings are loaded or saved; invalidates building-derived caches
+        self._buildings_version = 0
+        self._unassigned_cache = None
+        self._chief_index = None
+        # Suggested id for the next new building (max existing id + 1)
+        self.next_building_id = 1
+        # Data file mtimes at the last load/save, to skip re-parsing unchanged files
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self.loaded = False
+        # Inside batch(), save_students/save_groups are queued here and run once on exit
+        self._batch_depth = 0
+        self._pending_saves: Dict[str, object] = {}
+        # Notifications are saved on every click, so they are written off the calling thread
+        self._writer = AsyncWriter(self._write_json)
+        # Set by single reads/deletions, which are saved together by flush_notifications
+        self._notifications_dirty = False
+
+        if load:
+            self.load_all_data()
 
     def ensure_data_directory(self):
         if not os.path.exists(self.data_dir):
@@ -36,24 +82,131 @@ class DataManager:
         """Get the full path to a data file"""
         return os.path.join(self.data_dir, filename)
 
+    def _file_mtime(self, filename: str) -> Optional[int]:
+        """Modification time of a data file in ns, or None if it does not exist"""
+        try:
+            return os.stat(self.get_data_path(filename)).st_mtime_ns
+        except OSError:
+            return None
+
+    def _record_mtime(self, filename: str):
+        self._mtimes[filename] = self._file_mtime(filename)
+
+    def _read_json(self, filename: str):
+        """Parsed contents of a data file, or None if it is missing or unreadable"""
+        path = self.get_data_path(filename)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"Error reading {filename}: {e}\n{traceback.format_exc()}")
+            return None
+
+    @staticmethod
+    def _index_by_building(items) -> Dict[int, Dict]:
+        index = defaultdict(dict)
+        for item in items:
+            index[item.building_id][item.id] = item
+        return index
+
+    def _write_json(self, filename: str, data) -> None:
+        """Write data to a data file atomically (temp file, then rename)"""
+        path = self.get_data_path(filename)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        self._record_mtime(filename)
+
+    def flush_writes(self) -> None:
+        """Wait for background writes (notifications) to reach the disk"""
+        self._writer.flush()
+
+    @contextmanager
+    def batch(self):
+        """Defer student and group saves until the outermost batch exits"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending, self._pending_saves = self._pending_saves, {}
+                for saver in pending.values():
+                    saver()
+
+    def _defer_save(self, name: str, saver) -> bool:
+        """Queue a save while a batch is open; returns True if deferred"""
+        if self._batch_depth:
+            self._pending_saves[name] = saver
+            return True
+        return False
+
     def load_all_data(self):
+        self.load_files(*self.DATA_FILES)
+
+    def load_files(self, *filenames: str):
+        """Reload the given data files if they changed on disk"""
+        self.apply_data_files(self.read_data_files(*filenames))
+
+    def read_data_files(self, *filenames: str) -> Dict[str, tuple]:
+        """Read the data files (all by default) changed since they were last loaded or saved.
+
+        Nothing loaded is touched, so this can run on a worker thread; the result
+        is then passed to apply_data_files on the thread that uses the data.
+        Returns {filename: (mtime known before, mtime read, parsed data or None)}.
+        """
+        changed = {}
+        for filename in filenames or self.DATA_FILES:
+            known = self._mtimes.get(filename, _NOT_LOADED)
+            mtime = self._file_mtime(filename)
+            if known == mtime:
+                continue
+            changed[filename] = (known, mtime, self._read_json(filename))
+        return changed
+
+    def apply_data_files(self, changed: Dict[str, tuple]):
+        """Load files returned by read_data_files into memory.
+
+        A file saved from here since it was read is skipped, and so are notifications
+        with reads or deletions not yet written; the newer copy in memory wins.
+        """
+        loaders = {
+            'users.json': self.load_users,
+            'buildings.json': self.load_buildings,
+            'students.json': self.load_students,
+            'groups.json': self.load_groups,
+            'badges.json': self.load_badges,
+            'notifications.json': self.load_notifications,
+        }
         try:
-            self.load_users()
-            self.load_buildings()
-            self.load_students()
-            self.load_groups()
-            self.load_badges()
-            self.load_notifications()
+            for filename in self.DATA_FILES:
+                if filename not in changed:
+                    continue
+                known, mtime, data = changed[filename]
+                if self._mtimes.get(filename, _NOT_LOADED) != known:
+                    continue
+                if filename == 'notifications.json' and (
+                        self._notifications_dirty or self._writer.is_pending(filename)):
+                    continue
+                # Recorded first, so a default file written by the loader keeps its own mtime
+                self._mtimes[filename] = mtime
+                loaders[filename](data)
         except Exception as e:
             print(f"Error loading data: {e}\n{traceback.format_exc()}")
             self.initialize_default_data()
+        self.loaded = True
 
-    def load_users(self):
+    def load_users(self, users_data: Optional[Dict]):
         try:
-            users_path = self.get_data_path('users.json')
-            if os.path.exists(users_path):
-                with open(users_path, 'r', encoding='utf-8') as f:
-                    self.users = json.load(f)
+            if users_data is not None:
+                self.users = users_data
+                # Roles are compared against USER_ROLES on every screen switch
+                for user in self.users.values():
+                    if isinstance(user.get('role'), str):
+                        user['role'] = sys.intern(user['role'])
             else:
                 self.users = {}
                 self.create_default_admin()
@@ -75,21 +228,20 @@ class DataManager:
         self.users['admin'] = admin_user
         self.save_users()
 
-    def load_buildings(self):
+    def load_buildings(self, buildings_data: Optional[Dict]):
         try:
-            buildings_path = self.get_data_path('buildings.json')
-            if os.path.exists(buildings_path):
-                with open(buildings_path, 'r', encoding='utf-8') as f:
-                    buildings_data = json.load(f)
-                    self.buildings = {
-                        int(k): Building.from_dict(v)
-                        for k, v in buildings_data.items()
-                    }
+            if buildings_data is not None:
+                self.buildings = {
+                    int(k): Building.from_dict(v)
+                    for k, v in buildings_data.items()
+                }
             else:
                 self.create_default_buildings()
         except Exception as e:
             print(f"Error loading buildings: {e}\n{traceback.format_exc()}")
             self.create_default_buildings()
+        self.next_building_id = max(self.buildings, default=0) + 1
+        self._buildings_version += 1
 
     def create_default_buildings(self):
         self.buildings = {}
@@ -104,73 +256,95 @@ class DataManager:
             self.buildings[i] = building
         self.save_buildings()
 
-    def load_students(self):
+    def load_students(self, students_data: Optional[Dict]):
         try:
-            students_path = self.get_data_path('students.json')
-            if os.path.exists(students_path):
-                with open(students_path, 'r', encoding='utf-8') as f:
-                    students_data = json.load(f)
-                    self.students = {
-                        k: Student.from_dict(v)
-                        for k, v in students_data.items()
-                    }
+            if students_data is not None:
+                self.students = {
+                    k: Student.from_dict(v)
+                    for k, v in students_data.items()
+                }
             else:
                 self.students = {}
         except Exception as e:
             print(f"Error loading students: {e}\n{traceback.format_exc()}")
             self.students = {}
+        self.students_by_building = self._index_by_building(self.students.values())
+        self.badges_by_building = Counter()
+        for student in self.students.values():
+            self.badges_by_building[student.building_id] += len(student.badges)
+        for group in self.groups.values():
+            group.invalidate_member_names()
+        self._student_seq = {}
+        for student in self.students.values():
+            tail = student.id.rpartition('_')[2]
+            if tail.isdigit() and int(tail) > self._student_seq.get(student.building_id, 0):
+                self._student_seq[student.building_id] = int(tail)
 
     def save_students(self):
+        if self._defer_save('students', self.save_students):
+            return
         try:
-            students_path = self.get_data_path('students.json')
             students_data = {
                 s_id: s.to_dict()
                 for s_id, s in self.students.items()
             }
-            with open(students_path, 'w', encoding='utf-8') as f:
-                json.dump(students_data, f, indent=2, ensure_ascii=False)
+            self._write_json('students.json', students_data)
         except Exception as e:
             print(f"Error saving students: {e}\n{traceback.format_exc()}")
 
-    def load_groups(self):
+    def load_groups(self, groups_data: Optional[Dict]):
         try:
-            groups_path = self.get_data_path('groups.json')
-            if os.path.exists(groups_path):
-                with open(groups_path, 'r', encoding='utf-8') as f:
-                    groups_data = json.load(f)
-                    self.groups = {
-                        k: CleaningGroup.from_dict(v)
-                        for k, v in groups_data.items()
-                    }
+            if groups_data is not None:
+                self.groups = {
+                    k: CleaningGroup.from_dict(v)
+                    for k, v in groups_data.items()
+                }
             else:
                 self.groups = {}
         except Exception as e:
             print(f"Error loading groups: {e}\n{traceback.format_exc()}")
             self.groups = {}
+        self.groups_by_building = self._index_by_building(self.groups.values())
+        # Task stats are built from the groups' completed tasks
+        for student in self.students.values():
+            student.reset_task_stats()
 
-    def load_badges(self):
+    def load_badges(self, badges_data: Optional[Dict]):
         try:
-            badges_path = self.get_data_path('badges.json')
-            if os.path.exists(badges_path):
-                with open(badges_path, 'r', encoding='utf-8') as f:
-                    self.badges = json.load(f)
+            if badges_data is not None:
+                self.badges = badges_data
             else:
                 self.badges = {}
         except Exception as e:
             print(f"Error loading badges: {e}\n{traceback.format_exc()}")
             self.badges = {}
 
-    def load_notifications(self):
+    def load_notifications(self, notifications_data: Optional[List[Dict]]):
         try:
-            notifications_path = self.get_data_path('notifications.json')
-            if os.path.exists(notifications_path):
-                with open(notifications_path, 'r', encoding='utf-8') as f:
-                    self.notifications = json.load(f)
+            if notifications_data is not None:
+                self.notifications = [Notification.from_dict(n) for n in notifications_data]
+                self._notif_seq = 0
+                for notification in self.notifications:
+                    tail = notification.id.rpartition('_')[2]
+                    if tail.isdigit() and int(tail) > self._notif_seq:
+                        self._notif_seq = int(tail)
+                # Older files can repeat ids (they were numbered by list length); repeats
+                # get fresh ids, saved by the next flush, so lookups hit a single entry
+                self._notif_pos = {}
+                for pos, notification in enumerate(self.notifications):
+                    if not notification.id or notification.id in self._notif_pos:
+                        self._notif_seq += 1
+                        notification.id = f"notif_{self._notif_seq}"
+                        self._notifications_dirty = True
+                    self._notif_pos[notification.id] = pos
+                self._notif_version += 1
             else:
                 self.notifications = []
+                self._notif_pos = {}
         except Exception as e:
             print(f"Error loading notifications: {e}\n{traceback.format_exc()}")
             self.notifications = []
+            self._notif_pos = {}
 
     def save_all_data(self):
         try:
@@ -185,59 +359,57 @@ class DataManager:
 
     def save_users(self):
         try:
-            users_path = self.get_data_path('users.json')
-            with open(users_path, 'w', encoding='utf-8') as f:
-                json.dump(self.users, f, indent=2, ensure_ascii=False)
+            self._write_json('users.json', self.users)
         except Exception as e:
             print(f"Error saving users: {e}\n{traceback.format_exc()}")
 
     def save_buildings(self):
         try:
-            buildings_path = self.get_data_path('buildings.json')
             buildings_data = {
                 str(k): v.to_dict()
                 for k, v in self.buildings.items()
             }
-            with open(buildings_path, 'w', encoding='utf-8') as f:
-                json.dump(buildings_data, f, indent=2, ensure_ascii=False)
+            self._write_json('buildings.json', buildings_data)
         except Exception as e:
             print(f"Error saving buildings: {e}\n{traceback.format_exc()}")
+        finally:
+            # Every building mutation (add/remove, chief assignment) is followed by a save
+            self._buildings_version += 1
 
     def save_groups(self):
+        if self._defer_save('groups', self.save_groups):
+            return
         try:
-            groups_path = self.get_data_path('groups.json')
             groups_data = {
                 g_id: g.to_dict()
                 for g_id, g in self.groups.items()
             }
-            with open(groups_path, 'w', encoding='utf-8') as f:
-                json.dump(groups_data, f, indent=2, ensure_ascii=False)
+            self._write_json('groups.json', groups_data)
         except Exception as e:
             print(f"Error saving groups: {e}\n{traceback.format_exc()}")
 
     def save_badges(self):
         try:
-            badges_path = self.get_data_path('badges.json')
-            with open(badges_path, 'w', encoding='utf-8') as f:
-                json.dump(self.badges, f, indent=2, ensure_ascii=False)
+            self._write_json('badges.json', self.badges)
         except Exception as e:
             print(f"Error saving badges: {e}\n{traceback.format_exc()}")
 
     def save_notifications(self):
+        self._notifications_dirty = False
         try:
-            notifications_path = self.get_data_path('notifications.json')
-            with open(notifications_path, 'w', encoding='utf-8') as f:
-                json.dump(self.notifications, f, indent=2, ensure_ascii=False)
+            # Deletions reorder the list, so the file is written in timestamp order
+            ordered = sorted(self.notifications, key=attrgetter('timestamp'))
+            self._writer.submit('notifications.json', [n.to_dict() for n in ordered])
         except Exception as e:
             print(f"Error saving notifications: {e}\n{traceback.format_exc()}")
 
     def authenticate_user(self, username: str, password: str) -> Optional[Dict]:
-        if username in self.users:
-            user = self.users[username]
-            if user['password'] == password:
-                user['last_login'] = datetime.now().isoformat()
-                self.save_users()
-                return user
+        # self.users is keyed by username, so this is a single lookup
+        user = self.users.get(username)
+        if user is not None and user['password'] == password:
+            user['last_login'] = datetime.now().isoformat()
+            self.save_users()
+            return user
         return None
 
     def create_user(self, username: str, password: str, role: str,
@@ -272,7 +444,8 @@ class DataManager:
         building = self.buildings.get(student.building_id)
         if building and building.add_student(student.id):
             self.students[student.id] = student
-            self.save_students()
+            self.students_by_building[student.building_id][student.id] = student
+            self.badges_by_building[student.building_id] += len(student.badges)
             self.save_students()
             self.save_buildings()
             return True
@@ -286,12 +459,25 @@ class DataManager:
                 building.remove_student(student_id)
                 self.save_buildings()
             del self.students[student_id]
+            self.badges_by_building[student.building_id] -= len(student.badges)
+            building_students = self.students_by_building.get(student.building_id)
+            if building_students:
+                building_students.pop(student_id, None)
+            for group in self.groups_by_building.get(student.building_id, {}).values():
+                if student_id in group.members:
+                    group.invalidate_member_names()
             self.save_students()
             return True
         return False
 
+    def next_student_seq(self, building_id: int) -> int:
+        """Reserve the next sequence number for a new student id in the building"""
+        seq = self._student_seq.get(building_id, 0) + 1
+        self._student_seq[building_id] = seq
+        return seq
+
     def get_students_by_building(self, building_id: int) -> List[Student]:
-        return [s for s in self.students.values() if s.building_id == building_id]
+        return list(self.students_by_building.get(building_id, {}).values())
 
     def get_user_by_username(self, username: str) -> Optional[Dict]:
         return self.users.get(username)
@@ -307,17 +493,21 @@ class DataManager:
         if building.id in self.buildings:
             return False
         self.buildings[building.id] = building
+        self.next_building_id = max(self.next_building_id, building.id + 1)
         self.save_buildings()
         return True
 
     def remove_building(self, building_id: int) -> bool:
         try:
             if building_id in self.buildings:
-                students_to_remove = [sid for sid, s in self.students.items() if s.building_id == building_id]
-                for sid in students_to_remove:
-                    del self.students[sid]
+                for student_id in self.students_by_building.pop(building_id, {}):
+                    self.students.pop(student_id, None)
+                # The id can be handed out again, so its badge count must not carry over
+                self.badges_by_building.pop(building_id, None)
                 self.save_students()
                 del self.buildings[building_id]
+                if building_id + 1 == self.next_building_id:
+                    self.next_building_id = max(self.buildings, default=0) + 1
                 self.save_buildings()
                 return True
             return False
@@ -325,42 +515,70 @@ class DataManager:
             print(f"[Error while deleting building] {e}\n{traceback.format_exc()}")
             return False
 
+    def get_unassigned_building_labels(self) -> List[str]:
+        """'id - name' labels of buildings without a chief, cached until buildings change"""
+        cache = self._unassigned_cache
+        if cache is None or cache[0] != self._buildings_version:
+            labels = [f"{b.id} - {b.name}" for b in self.buildings.values() if not b.chief_id]
+            cache = self._unassigned_cache = (self._buildings_version, labels)
+        return list(cache[1])
+
     def get_building_by_chief(self, chief_username: str) -> Optional[Building]:
-        for building in self.buildings.values():
-            if building.chief_id == chief_username:
-                return building
-        return None
+        """Building managed by the given chief, via an index rebuilt when buildings change"""
+        index = self._chief_index
+        if index is None or index[0] != self._buildings_version:
+            by_chief = {}
+            for building in self.buildings.values():
+                if building.chief_id:
+                    by_chief.setdefault(building.chief_id, building)
+            index = self._chief_index = (self._buildings_version, by_chief)
+        return index[1].get(chief_username)
 
     def add_group(self, group: CleaningGroup) -> bool:
         if group.id in self.groups:
             return False
         self.groups[group.id] = group
+        self.groups_by_building[group.building_id][group.id] = group
+        self._reset_members_task_stats(group)
         self.save_groups()
         return True
 
     def remove_group(self, group_id: str) -> bool:
         if group_id in self.groups:
-            del self.groups[group_id]
+            group = self.groups.pop(group_id)
+            building_groups = self.groups_by_building.get(group.building_id)
+            if building_groups:
+                building_groups.pop(group_id, None)
+            self._reset_members_task_stats(group)
             self.save_groups()
             return True
         return False
 
+    def _reset_members_task_stats(self, group: CleaningGroup):
+        """Rebuild the task stats of a group's members after the group was added or removed"""
+        for student_id in group.members:
+            student = self.students.get(student_id)
+            if student is not None:
+                student.reset_task_stats()
+
     def get_groups_by_building(self, building_id: int) -> List[CleaningGroup]:
-        return [g for g in self.groups.values() if g.building_id == building_id]
+        return list(self.groups_by_building.get(building_id, {}).values())
 
     def add_notification(self, message: str, notification_type: str,
                          target_user: str = None, public: bool = False):
         """Add a notification with enhanced features."""
-        notification = {
-            'id': f"notif_{len(self.notifications) + 1}",
-            'message': message,
-            'type': notification_type,
-            'target_user': target_user if target_user is not None else '',
-            'timestamp': datetime.now().isoformat(),
-            'read': False,
-            'public': public
-        }
+        self._notif_seq += 1
+        notification = Notification(
+            id=f"notif_{self._notif_seq}",
+            message=message,
+            type=notification_type,
+            target_user=target_user if target_user is not None else '',
+            timestamp=datetime.now().isoformat(),
+            public=public
+        )
+        self._notif_pos[notification.id] = len(self.notifications)
         self.notifications.append(notification)
+        self._notif_version += 1
         self.save_notifications()
 
     def add_public_notification(self, message: str, notification_type: str = 'INFO'):
@@ -414,39 +632,86 @@ class DataManager:
                 building.chief_id
             )
 
-    def get_notifications_for_user(self, user_id: str) -> List[Dict]:
+    def get_notifications_for_user(self, user_id: str) -> List[Notification]:
         """Get notifications for a specific user (private + public)."""
         return [n for n in self.notifications 
-                if n.get('target_user') == user_id or n.get('public', False)]
+                if n.target_user == user_id or n.public]
 
-    def get_public_notifications(self) -> List[Dict]:
+    def get_public_notifications(self) -> List[Notification]:
         """Get only public notifications."""
-        return [n for n in self.notifications if n.get('public', False)]
+        return [n for n in self.notifications if n.public]
+
+    @property
+    def notifications_version(self) -> int:
+        """Changes whenever a notification is added, deleted, marked read or reloaded."""
+        return self._notif_version
+
+    def query_notifications(self, user_id: str, notification_type: Optional[str] = None,
+                            read: Optional[bool] = None) -> List[Notification]:
+        """Get a user's notifications, newest first, optionally filtered by type and read status.
+
+        Results are cached until the notifications next change, so the returned
+        list is shared and must not be modified.
+        """
+        if self._notif_query_version != self._notif_version:
+            self._notif_query_cache = {}
+            self._notif_query_version = self._notif_version
+        key = (user_id, notification_type, read)
+        result = self._notif_query_cache.get(key)
+        if result is None:
+            if notification_type is None and read is None:
+                result = sorted(self.get_notifications_for_user(user_id),
+                                key=attrgetter('timestamp'), reverse=True)
+            else:
+                result = [n for n in self.query_notifications(user_id)
+                          if (notification_type is None or n.type == notification_type)
+                          and (read is None or n.read == read)]
+            self._notif_query_cache[key] = result
+        return result
 
     def get_unread_notifications_count(self, user_id: str) -> int:
         """Get count of unread notifications for a user."""
-        return len([n for n in self.get_notifications_for_user(user_id) 
-                   if not n.get('read', False)])
+        return len(self.query_notifications(user_id, read=False))
+
+    def get_notification(self, notification_id: str) -> Optional[Notification]:
+        pos = self._notif_pos.get(notification_id)
+        return None if pos is None else self.notifications[pos]
 
     def mark_notification_read(self, notification_id: str):
-        """Mark a notification as read."""
-        for notification in self.notifications:
-            if notification['id'] == notification_id:
-                notification['read'] = True
-                self.save_notifications()
-                break
+        """Mark a notification as read (saved by the next flush_notifications)."""
+        notification = self.get_notification(notification_id)
+        if notification is not None:
+            notification.read = True
+            self._notif_version += 1
+            self._notifications_dirty = True
 
     def mark_all_notifications_read(self, user_id: str):
         """Mark all notifications as read for a user."""
         for notification in self.notifications:
-            if (notification.get('target_user') == user_id or notification.get('public', False)) and not notification.get('read', False):
-                notification['read'] = True
+            if (notification.target_user == user_id or notification.public) and not notification.read:
+                notification.read = True
+        self._notif_version += 1
         self.save_notifications()
 
     def delete_notification(self, notification_id: str):
-        """Delete a notification."""
-        self.notifications = [n for n in self.notifications if n.get('id') != notification_id]
-        self.save_notifications()
+        """Delete a notification (saved by the next flush_notifications).
+
+        The last notification is moved into the freed slot, so list order is not
+        kept in memory; saves and exports sort by timestamp.
+        """
+        pos = self._notif_pos.pop(notification_id, None)
+        if pos is not None:
+            last = self.notifications.pop()
+            if pos < len(self.notifications):
+                self.notifications[pos] = last
+                self._notif_pos[last.id] = pos
+            self._notif_version += 1
+            self._notifications_dirty = True
+
+    def flush_notifications(self):
+        """Save notifications if reads or deletions are still unsaved."""
+        if self._notifications_dirty:
+            self.save_notifications()
 
     def get_building_by_group(self, group_id: str):
         """Get building by group ID."""
@@ -456,14 +721,14 @@ class DataManager:
         return None
 
     def create_backup(self) -> Optional[str]:
+        self.flush_writes()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         backup_dir = f"data/backup_{timestamp}"
         try:
             os.makedirs(backup_dir, exist_ok=True)
             for file_path in DATA_PATHS.values():
-                if os.path.exists(file_path):
-                    filename = os.path.basename(file_path)
-                    shutil.copy2(file_path, os.path.join(backup_dir, filename))
+                if file_path.exists():
+                    shutil.copy2(file_path, os.path.join(backup_dir, file_path.name))
             return backup_dir
         except Exception as e:
             print(f"Error creating backup: {e}\n{traceback.format_exc()}")
@@ -482,7 +747,7 @@ class DataManager:
         activities = []
         for notif in self.notifications:
             # Format the activity type for display
-            activity_type = notif.get('type', '')
+            activity_type = notif.type
             if activity_type == 'TASK_COMPLETED':
                 display_type = 'TASK_COMPLETED'
             elif activity_type == 'BADGE_EARNED':
@@ -493,19 +758,19 @@ class DataManager:
                 display_type = activity_type
             
             # Format the description for clarity
-            description = notif.get('message', '')
+            description = notif.message
             if len(description) > 80:
                 description = description[:77] + "..."
             
             activities.append({
-                'timestamp': notif.get('timestamp', ''),
+                'timestamp': notif.timestamp,
                 'type': display_type,
                 'description': description,
-                'user': notif.get('target_user', 'System'),
-                'full_message': notif.get('message', '')
+                'user': notif.target_user,
+                'full_message': notif.message
             })
         # Sort by date descending and limit to 50 activities
-        activities.sort(key=lambda x: x['timestamp'], reverse=True)
+        activities.sort(key=itemgetter('timestamp'), reverse=True)
         return activities[:50]
 
     def get_backup_history(self) -> list:
@@ -527,10 +792,29 @@ class DataManager:
         backups.sort(key=lambda x: x['created'], reverse=True)
         return backups
 
+    def record_task_completion(self, group: CleaningGroup, date: str, area: str,
+                               completed_by: List[str], quality_score: int):
+        """Save a validated task in the group's history and the members' running stats.
+
+        Re-validating a task that is already completed only updates its score.
+        """
+        if group.update_task_quality(date, area, quality_score):
+            return
+
+        # Seed the members' stats before the new task joins the history they are built from
+        members = [self.students[student_id] for student_id in completed_by
+                   if student_id in self.students]
+        member_stats = [student.get_task_stats(self.groups) for student in members]
+
+        completion_time = datetime.now()
+        group.mark_task_completed(date, area, list(completed_by), completion_time, quality_score)
+        for stats in member_stats:
+            stats.record(completion_time)
+
     def check_and_award_badges(self, student: Student):
         """Check student's performance and award badges if criteria are met."""
         # Badge 'Consistent': completed tasks for 30 days
-        if student.get_tasks_in_last_30_days(self.groups) >= 10: # At least 10 tasks
+        if student.get_task_stats(self.groups).recent_count(datetime.now()) >= 10: # At least 10 tasks
             self._award_badge(student, 'CONSISTENT')
         
         # Badge 'Punctual' (simplified logic)
@@ -550,6 +834,7 @@ class DataManager:
         if badge_type not in self.badges[student.id]:
             self.badges[student.id].append(badge_type)
             student.badges.append(badge_type)
+            self.badges_by_building[student.building_id] += 1
             self.add_badge_notification(student.id, badge_type)
             self.save_badges()
             self.save_students()
\ No newline at end of file
@@ -6,13 +6,19 @@ Handles data export to CSV and other formats
 import csv
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Dict, List, Any, Optional
 from models.student import Student
 from models.building import Building
 from models.group import CleaningGroup
+from models.notification import Notification
 import traceback
 
+# CSV rows are collected in a 1 MB buffer and written in large chunks
+WRITE_BUFFER_SIZE = 1024 * 1024
+
 class DataExporter:
     """Service for exporting application data to various formats"""
 
@@ -33,7 +39,7 @@ class DataExporter:
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'ID', 'Name', 'Building', 'Block', 'Room',
                     'Phone', 'Email', 'Completion Rate (%)',
@@ -77,7 +83,7 @@ class DataExporter:
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Date', 'Day', 'Building', 'Group', 'Area',
                     'Assigned Members', 'Time Slot', 'Status', 'Priority'
@@ -121,7 +127,7 @@ class DataExporter:
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Building ID', 'Building Name', 'Building Chief',
                     'Total Students', 'Occupancy Rate (%)',
@@ -161,7 +167,7 @@ class DataExporter:
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Group ID', 'Group Name', 'Building', 'Members',
                     'Assigned Areas', 'Completion Rate (%)',
@@ -202,7 +208,7 @@ class DataExporter:
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'Student ID', 'Student Name', 'Building', 'Total Badges',
                     'Badge Types', 'Last Awarded'
@@ -233,14 +239,14 @@ class DataExporter:
             print(f"Error exporting badge summary to CSV: {e}\n{traceback.format_exc()}")
             return None
 
-    def export_notifications_to_csv(self, notifications: List[Dict]) -> str:
+    def export_notifications_to_csv(self, notifications: List[Notification]) -> str:
         """Export notifications to CSV"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f"notifications_{timestamp}.csv"
         filepath = os.path.join(self.export_dir, filename)
 
         try:
-            with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
+            with open(filepath, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as csvfile:
                 fieldnames = [
                     'ID', 'Type', 'Message', 'Target User',
                     'Date/Time', 'Read'
@@ -249,14 +255,14 @@ class DataExporter:
                 writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
                 writer.writeheader()
 
-                for notification in notifications:
+                for notification in sorted(notifications, key=attrgetter('timestamp')):
                     writer.writerow({
-                        'ID': notification.get('id', ''),
-                        'Type': notification.get('type', ''),
-                        'Message': notification.get('message', ''),
-                        'Target User': notification.get('target_user', 'All'),
-                        'Date/Time': notification.get('timestamp', ''),
-                        'Read': 'Yes' if notification.get('read', False) else 'No'
+                        'ID': notification.id,
+                        'Type': notification.type,
+                        'Message': notification.message,
+                        'Target User': notification.target_user,
+                        'Date/Time': notification.timestamp,
+                        'Read': 'Yes' if notification.read else 'No'
                     })
 
             return filepath
@@ -268,18 +274,18 @@ class DataExporter:
                              buildings: Dict[int, Building],
                              groups: Dict[str, CleaningGroup],
                              badges_data: Dict[str, List],
-                             notifications: List[Dict]) -> List[str]:
+                             notifications: List[Notification]) -> List[str]:
         """Export complete system report with all data"""
-        exported_files = []
-
-        # Export all individual reports
-        exports = [
-            self.export_students_to_csv(students, buildings),
-            self.export_building_performance_to_csv(buildings, students),
-            self.export_group_performance_to_csv(groups),
-            self.export_badge_summary_to_csv(students, badges_data),
-            self.export_notifications_to_csv(notifications)
-        ]
+        # Each report only reads the data and writes its own file, so they run side by side
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            futures = [
+                executor.submit(self.export_students_to_csv, students, buildings),
+                executor.submit(self.export_building_performance_to_csv, buildings, students),
+                executor.submit(self.export_group_performance_to_csv, groups),
+                executor.submit(self.export_badge_summary_to_csv, students, badges_data),
+                executor.submit(self.export_notifications_to_csv, notifications)
+            ]
+            exports = [future.result() for future in futures]
 
         # Filter out None values (failed exports)
         exported_files = [f for f in exports if f is not None]
@@ -5,6 +5,8 @@ Handles automatic scheduling and rotation of cleaning tasks
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+import heapq
+import math
 import random
 
 from models.student import Student
@@ -94,7 +96,7 @@ class CleaningScheduler:
                     group_name = f"Group {block}{i+1} - Building {building.name}"
 
                     # Use all default cleaning areas
-                    assigned_areas = building.custom_cleaning_areas if building.custom_cleaning_areas else self.default_areas.copy()
+                    assigned_areas = building.custom_cleaning_areas if building.custom_cleaning_areas else list(self.default_areas)
 
                     group = CleaningGroup(
                         id=group_id,
@@ -108,6 +110,23 @@ class CleaningScheduler:
 
         return groups
 
+    def partition_students(self, students: List[Student], group_size: int) -> List[List[Student]]:
+        """Split students into ceil(n / group_size) groups of near-equal size.
+
+        Greedy-sorted partition: students are taken by descending badge count and
+        each goes to the group with the fewest members (then the lightest badge load).
+        """
+        if not students:
+            return []
+        num_groups = max(1, math.ceil(len(students) / max(group_size, 1)))
+        groups: List[List[Student]] = [[] for _ in range(num_groups)]
+        heap = [(0, 0, i) for i in range(num_groups)]
+        for student in sorted(students, key=lambda s: len(s.badges), reverse=True):
+            size, load, i = heapq.heappop(heap)
+            groups[i].append(student)
+            heapq.heappush(heap, (size + 1, load + len(student.badges), i))
+        return groups
+
     def _create_daily_schedule(self, building: Building, 
                                 groups: List[CleaningGroup],
                                 date: datetime,
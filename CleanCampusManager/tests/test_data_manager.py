@@ -0,0 +1,128 @@
+"""
+Tests for the DataManager service
+Run from the CleanCampusManager directory: python -m unittest discover tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+
+from datetime import datetime
+
+from models.building import Building
+from models.group import CleaningGroup
+from models.student import Student
+from services.data_manager import DataManager
+
+
+class DataManagerTestCase(unittest.TestCase):
+    """DataManager working on a temporary data directory"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.dm = DataManager(load=False)
+        self.dm.data_dir = self._tmp.name
+        self.addCleanup(self.dm.flush_writes)
+
+    def write_file(self, filename: str, data):
+        with open(os.path.join(self._tmp.name, filename), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def read_file(self, filename: str):
+        self.dm.flush_writes()
+        with open(os.path.join(self._tmp.name, filename), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+
+class NotificationTests(DataManagerTestCase):
+
+    def test_duplicate_ids_are_renumbered_and_delete_hits_one_entry(self):
+        self.write_file('notifications.json', [
+            {'id': 'notif_1', 'message': 'first', 'timestamp': '2025-01-01T10:00:00'},
+            {'id': 'notif_2', 'message': 'second', 'timestamp': '2025-01-02T10:00:00'},
+            {'id': 'notif_2', 'message': 'third', 'timestamp': '2025-01-03T10:00:00'},
+        ])
+        self.dm.load_all_data()
+
+        ids = [n.id for n in self.dm.notifications]
+        self.assertEqual(len(set(ids)), 3)
+        self.assertEqual(ids[:2], ['notif_1', 'notif_2'])
+
+        self.dm.delete_notification('notif_2')
+        self.assertEqual(sorted(n.message for n in self.dm.notifications), ['first', 'third'])
+        for notification in self.dm.notifications:
+            self.assertIs(self.dm.get_notification(notification.id), notification)
+
+        self.dm.flush_notifications()
+        saved = self.read_file('notifications.json')
+        self.assertEqual([n['message'] for n in saved], ['first', 'third'])
+        self.assertEqual(len({n['id'] for n in saved}), 2)
+
+
+class BuildingTests(DataManagerTestCase):
+
+    def test_badge_count_does_not_carry_over_to_a_reused_building_id(self):
+        self.dm.load_all_data()
+        building_id = self.dm.next_building_id
+        self.assertTrue(self.dm.add_building(Building(id=building_id, name='Old')))
+        student = Student(id='s1', name='A', building_id=building_id, block='A',
+                          room_number=1, badges=['CONSISTENT', 'PUNCTUAL'])
+        self.assertTrue(self.dm.add_student(student))
+        self.assertEqual(self.dm.badges_by_building[building_id], 2)
+
+        self.assertTrue(self.dm.remove_building(building_id))
+        self.assertEqual(self.dm.next_building_id, building_id)
+        self.assertTrue(self.dm.add_building(Building(id=building_id, name='New')))
+        self.assertEqual(self.dm.badges_by_building[building_id], 0)
+
+
+class TaskCompletionTests(DataManagerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.dm.load_all_data()
+        building_id = next(iter(self.dm.buildings))
+        self.student = Student(id='s1', name='A', building_id=building_id, block='A', room_number=1)
+        self.assertTrue(self.dm.add_student(self.student))
+        self.group = CleaningGroup(id='g1', name='G', building_id=building_id, members=['s1'])
+        self.assertTrue(self.dm.add_group(self.group))
+
+    def recent_count(self, student: Student) -> int:
+        return student.get_task_stats(self.dm.groups).recent_count(datetime.now())
+
+    def test_completed_tasks_round_trip_through_groups_file(self):
+        self.dm.record_task_completion(self.group, '2025-01-01', 'Hall', ['s1'], 4)
+        self.dm.record_task_completion(self.group, '2025-01-01', 'Hall', ['s1'], 2)
+        self.dm.record_task_completion(self.group, '2025-01-02', 'Hall', ['s1'], 5)
+        self.assertEqual(self.recent_count(self.student), 2)
+        self.dm.save_groups()
+        self.dm.flush_writes()
+
+        reloaded = DataManager(load=False)
+        reloaded.data_dir = self.dm.data_dir
+        reloaded.load_all_data()
+        group = reloaded.groups['g1']
+        self.assertEqual(group.completed_tasks, self.group.completed_tasks)
+        self.assertEqual([t['quality_score'] for t in group.completed_tasks], [2, 5])
+        self.assertEqual(group.group_performance_score, self.group.group_performance_score)
+        self.assertEqual(self.recent_count(reloaded.students['s1']), 2)
+
+    def test_task_stats_follow_group_changes(self):
+        self.dm.record_task_completion(self.group, '2025-01-01', 'Hall', ['s1'], 5)
+        self.assertEqual(self.recent_count(self.student), 1)
+
+        self.dm.remove_group('g1')
+        self.assertEqual(self.recent_count(self.student), 0)
+
+        self.dm.add_group(self.group)
+        self.assertEqual(self.recent_count(self.student), 1)
+
+        self.dm.flush_writes()
+        self.dm.load_groups(None)
+        self.assertEqual(self.recent_count(self.student), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()